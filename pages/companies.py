@@ -11,6 +11,7 @@ from services.async_ui import run_async
 from services.firebase_db import list_companies
 from services.firebase_client import get_db
 from services.firestore_compat import eq
+from services.firebase_auth import invalidate_company
 
 # ───────────────────────── utils ─────────────────────────
 def _s(v: Any) -> str:
@@ -348,6 +349,7 @@ class CompaniesPage(PageShell):
                 raise RuntimeError("Firestore not configured")
             ref = db.collection("companies").document(target_doc)
             ref.update({"suspended": bool(to_suspend), "active": (not to_suspend)})
+            invalidate_company(target_doc)
             return True
 
         def _done(result):
@@ -17,6 +17,7 @@ from services.account import (
     delete_account,
 )
 from services.firebase_client import get_db
+from services.async_ui import run_async
 
 EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
@@ -220,7 +221,8 @@ class ChangePasswordDialog(_BaseDialog):
         btns = tk.Frame(self.body, bg=PALETTE["card"])
         btns.grid(row=5, column=0, columnspan=2, sticky="e", pady=(10, 0))
         ttk.Button(btns, text="Cancel", style="Danger.TButton", command=self._close).pack(side="right", padx=(8, 0))
-        ttk.Button(btns, text="Update Password", style="Primary.TButton", command=self._save).pack(side="right")
+        self.btn_save = ttk.Button(btns, text="Update Password", style="Primary.TButton", command=self._save)
+        self.btn_save.pack(side="right")
 
     def _save(self):
         old_pw = self.pw_old.get()
@@ -233,12 +235,19 @@ class ChangePasswordDialog(_BaseDialog):
         if new_pw != cnf_pw: return err("New passwords do not match.")
         issues = _pw_issues(new_pw)
         if issues: return err("Password must have:\n" + "\n".join(issues))
-        try:
-            _bridge_change_password(self._email, old_pw, new_pw)
-        except Exception as e:
-            return err(str(e))
-        messagebox.showinfo("Password", "Password changed successfully.")
-        self._close()
+
+        def _done(result):
+            if isinstance(result, Exception):
+                self.btn_save.configure(state="normal")
+                return err(str(result))
+            messagebox.showinfo("Password", "Password changed successfully.")
+            self._close()
+
+        # block double-submits while the hash runs
+        self.btn_save.configure(state="disabled")
+        self.status.configure(text="Working…", foreground=PALETTE.get("muted", "#6b7280"))
+        # password hashing is CPU-bound; keep it off the UI thread and the I/O pool
+        run_async(lambda: _bridge_change_password(self._email, old_pw, new_pw), _done, self, kind="cpu")
 
 
 class ResetPasswordDialog(_BaseDialog):
@@ -309,12 +318,18 @@ class ResetPasswordDialog(_BaseDialog):
         if new_pw != cnf_pw: return err("New passwords do not match.")
         issues = _pw_issues(new_pw)
         if issues: return err("Password must have:\n" + "\n".join(issues))
-        try:
-            verify_password_reset(email, otp, new_pw)
-        except Exception as e:
-            return err(str(e))
-        messagebox.showinfo("Password", "Password reset successfully.")
-        self._close()
+
+        def _done(result):
+            if isinstance(result, Exception):
+                self.btn_apply.configure(state="normal")
+                return err(str(result))
+            messagebox.showinfo("Password", "Password reset successfully.")
+            self._close()
+
+        # a second submit would race on the OTP the first one consumes
+        self.btn_apply.configure(state="disabled")
+        self.status.configure(text="Working…", foreground=PALETTE.get("muted", "#6b7280"))
+        run_async(lambda: verify_password_reset(email, otp, new_pw), _done, self, kind="cpu")
 
 
 class DeleteAccountDialog(_BaseDialog):
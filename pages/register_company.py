@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 
 from services.ui_theme import apply_theme, card, FONTS, PALETTE
+from services.async_ui import run_async
 from services.firebase_registration import (
     begin_company_registration,
     confirm_company_registration,
@@ -224,14 +225,18 @@ class RegisterCompanyPage(tk.Frame):
             self.status.config(text="Password must be at least 8 characters.")
             return
 
-        # Submit
-        try:
-            self.register_btn.config(state="disabled", text="Sending…")
-            self.reg_id = begin_company_registration(email, pw, name, aname)
+        # Submit (hashing + Firestore run off the Tk thread)
+        self.register_btn.config(state="disabled", text="Sending…")
+
+        def _done(result):
+            if isinstance(result, Exception):
+                self.status.config(text=str(result))
+                self.register_btn.config(state="normal", text="Register")
+                return
+            self.reg_id = result
             self._build_step2(email)
-        except Exception as e:
-            self.status.config(text=str(e))
-            self.register_btn.config(state="normal", text="Register")
+
+        run_async(lambda: begin_company_registration(email, pw, name, aname), _done, self)
 
     # ───────────────────────── Step 2 ─────────────────────────
     def _build_step2(self, email_dest: str):
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import io
 import csv
+import bisect
+import functools
+import itertools
 import threading
 import datetime as _dt
 from dataclasses import dataclass
@@ -24,14 +27,17 @@ except Exception:
     def list_cameras_by_zone(_zid: str) -> List[Dict[str, Any]]:
         return []
 
-# Optional matplotlib (charts). If missing, PDF export will skip charts gracefully.
-try:
-    import matplotlib
-    matplotlib.use("Agg")  # headless
-    import matplotlib.pyplot as plt
-    _HAVE_MPL = True
-except Exception:
-    _HAVE_MPL = False
+# Optional matplotlib (charts). Imported on first PDF export, not at page load.
+# If missing, PDF export will skip charts gracefully.
+@functools.lru_cache(maxsize=1)
+def _mpl():
+    try:
+        import matplotlib
+        matplotlib.use("Agg")  # headless
+        import matplotlib.pyplot as plt
+        return plt
+    except Exception:
+        return None
 
 # Optional PDF (reportlab)
 try:
@@ -40,7 +46,15 @@ try:
     from reportlab.pdfgen import canvas as _rl_canvas
     from reportlab.lib.utils import ImageReader
     from reportlab.pdfbase import pdfmetrics
+    from reportlab.lib.colors import Color
     _HAVE_RL = True
+
+    # table colours, built once instead of per setFillColorRGB call
+    _HEADER_BG = Color(0.91, 0.96, 1.0)
+    _ROW_ALT   = Color(0.98, 0.99, 1.0)
+    _INK       = Color(0.13, 0.15, 0.20)
+    _INK2      = Color(0.10, 0.12, 0.18)
+    _INK_MUTED = Color(0.25, 0.28, 0.35)
 except Exception:
     _HAVE_RL = False
 
@@ -1481,7 +1495,8 @@ class ReportsPage(PageShell):
         from reportlab.lib.utils import ImageReader
 
         page_w, page_h = A4
-        c = _rl_canvas.Canvas(path, pagesize=A4)
+        # Write straight to the target file; compress each page stream as it is flushed.
+        c = _rl_canvas.Canvas(path, pagesize=A4, pageCompression=1)
 
         # Header
         try:
@@ -1532,7 +1547,10 @@ class ReportsPage(PageShell):
             return y - 0.2*cm
 
         def charts_block(y: float) -> float:
-            if not _HAVE_MPL or not rows:
+            if not rows:
+                return y
+            plt = _mpl()
+            if plt is None:
                 return y
             ppe_sel = ((selected_filters or {}).get("ppe_sel") or "all").lower()
             level_sel = ((selected_filters or {}).get("level_sel") or "all").lower()
@@ -1752,7 +1770,8 @@ class ReportsPage(PageShell):
                 ax.grid(True, axis="y", linestyle="--", alpha=0.3)
                 fig.tight_layout()
                 buf = io.BytesIO()
-                fig.savefig(buf, format="png", bbox_inches="tight")
+                # tight_layout already fits the axes; bbox_inches="tight" would render twice
+                fig.savefig(buf, format="png")
                 plt.close(fig)
                 buf.seek(0)
                 img = ImageReader(buf)
@@ -1784,21 +1803,58 @@ class ReportsPage(PageShell):
             words = (text or "").split()
             if not words:
                 return [""]
-            lines: List[str] = []
-            cur = words[0]
-            for w in words[1:]:
-                trial = cur + " " + w
-                wpx = pdfmetrics.stringWidth(
-                    trial,
-                    font_name,
-                    font_size,
+            # cum[i] = width of words[:i], each followed by a space; a line
+            # words[a:b] is then cum[b] - cum[a] - space_w wide (no trial strings)
+            space_w = pdfmetrics.stringWidth(" ", font_name, font_size)
+            cum = [0.0]
+            cum.extend(
+                itertools.accumulate(
+                    pdfmetrics.stringWidth(w, font_name, font_size) + space_w
+                    for w in words
                 )
-                if wpx <= max_width_pts:
-                    cur = trial
-                else:
-                    lines.append(cur)
-                    cur = w
-            lines.append(cur)
+            )
+            lines: List[str] = []
+            n = len(words)
+            start = 0
+            while start < n:
+                limit = cum[start] + max_width_pts + space_w
+                end = bisect.bisect_right(cum, limit, start + 1) - 1
+                end = max(end, start + 1)  # an over-wide word still gets its own line
+                lines.append(" ".join(words[start:end]))
+                start = end
+            return lines
+
+        # wrapped lines per (text, font, width); repeated values (status, zone…)
+        # are wrapped once per report. Lives only as long as this export.
+        wrap_cache: Dict[Tuple[str, str, float, float], List[str]] = {}
+
+        def cell_lines(
+            text: str,
+            font_name: str,
+            font_size: float,
+            max_width_pts: float,
+        ) -> List[str]:
+            key = (text, font_name, font_size, max_width_pts)
+            cached = wrap_cache.get(key)
+            if cached is not None:
+                return cached
+            multiline = "\n" in text or "\r" in text
+            # fast path: most cells are short single-line values that need no wrapping
+            if not multiline and pdfmetrics.stringWidth(text, font_name, font_size) <= max_width_pts:
+                lines = [text]
+            else:
+                parts = (text.splitlines() or [""]) if multiline else (text,)
+                lines = []
+                for ln in parts:
+                    lines.extend(
+                        wrap_text(
+                            ln,
+                            font_name,
+                            font_size,
+                            max_width_pts,
+                        )
+                    )
+            wrap_cache[key] = lines
             return lines
 
         def draw_cell(
@@ -1808,24 +1864,24 @@ class ReportsPage(PageShell):
             text: str,
             font_name="Helvetica",
             font_size=9,
+            lines: Optional[List[str]] = None,
+            set_font: bool = True,
         ) -> float:
-            c.setFont(font_name, font_size)
-            lines = []
-            for ln in (text or "").splitlines() or [""]:
-                lines.extend(
-                    wrap_text(
-                        ln,
-                        font_name,
-                        font_size,
-                        wcol - 6,
-                    )
-                )
+            if set_font:
+                c.setFont(font_name, font_size)
+            if lines is None:
+                lines = cell_lines(text or "", font_name, font_size, wcol - 6)
             line_h = font_size * 1.2
-            used = 0.0
+            if len(lines) == 1:
+                c.drawString(x, y, lines[0])
+                return line_h
+            # one BT…ET block for all lines instead of one per drawString
+            to = c.beginText(x, y)
+            to.setFont(font_name, font_size, leading=line_h)
             for ln in lines:
-                c.drawString(x, y - used, ln)
-                used += line_h
-            return used
+                to.textLine(ln)
+            c.drawText(to)
+            return line_h * len(lines)
 
         def table_block(y: float):
             base_defs = [
@@ -1835,7 +1891,7 @@ class ReportsPage(PageShell):
 
             x0 = 2*cm
             y0 = y
-            c.setFillColorRGB(0.91, 0.96, 1.0)
+            c.setFillColor(_HEADER_BG)
             total_w = sum(w for _, w in base_defs)
             c.rect(
                 x0,
@@ -1845,7 +1901,7 @@ class ReportsPage(PageShell):
                 stroke=0,
                 fill=1,
             )
-            c.setFillColorRGB(0.10, 0.12, 0.18)
+            c.setFillColor(_INK2)
             c.setFont("Helvetica-Bold", 10)
             x = x0
             for name, wcol in base_defs:
@@ -1856,31 +1912,29 @@ class ReportsPage(PageShell):
             font_name = "Helvetica"; font_size = 9
             row_gap = 0.15*cm
             max_rows = 2000
-            shown = 0
-            for idx, r in enumerate(rows):
-                heights = []
-                for (name, wcol), val in zip(base_defs, r):
-                    lines = []
-                    for ln in (str(val) if val is not None else "").splitlines() or [""]:
-                        lines.extend(
-                            wrap_text(
-                                ln,
-                                font_name,
-                                font_size,
-                                wcol - 6,
-                            )
-                        )
-                    heights.append(
-                        len(lines) * (font_size * 1.2)
+            line_h = font_size * 1.2
+            # body font/ink are only re-issued after something else changed them
+            font_ok = ink_ok = False
+            # never wrap/measure rows past the cutoff
+            for idx, r in enumerate(rows[:max_rows]):
+                # wrap each cell once; the same lines size the row and get drawn
+                row_lines = [
+                    cell_lines(
+                        "" if val is None else str(val),
+                        font_name,
+                        font_size,
+                        wcol - 6,
                     )
-                row_h = max(heights) + row_gap
+                    for (name, wcol), val in zip(base_defs, r)
+                ]
+                row_h = max((len(ls) for ls in row_lines), default=1) * line_h + row_gap
 
                 if y - row_h < 3*cm:
                     c.showPage()
                     header()
                     y = page_h - 3.2*cm
                     x = x0
-                    c.setFillColorRGB(0.91, 0.96, 1.0)
+                    c.setFillColor(_HEADER_BG)
                     c.rect(
                         x0,
                         y-0.45*cm,
@@ -1889,15 +1943,16 @@ class ReportsPage(PageShell):
                         stroke=0,
                         fill=1,
                     )
-                    c.setFillColorRGB(0.10, 0.12, 0.18)
+                    c.setFillColor(_INK2)
                     c.setFont("Helvetica-Bold", 10)
                     for name, wcol in base_defs:
                         c.drawString(x+3, y-0.15*cm, name)
                         x += wcol
                     y -= 0.8*cm
+                    font_ok = ink_ok = False
 
                 if idx % 2 == 0:
-                    c.setFillColorRGB(0.98, 0.99, 1.0)
+                    c.setFillColor(_ROW_ALT)
                     c.rect(
                         x0,
                         y - row_h + row_gap/2,
@@ -1906,31 +1961,38 @@ class ReportsPage(PageShell):
                         stroke=0,
                         fill=1,
                     )
-
-                c.setFillColorRGB(0.13, 0.15, 0.20)
+                    ink_ok = False
+
+                if not font_ok:
+                    c.setFont(font_name, font_size)
+                    font_ok = True
+                if not ink_ok:
+                    c.setFillColor(_INK)
+                    ink_ok = True
                 x = x0
-                for (name, wcol), val in zip(base_defs, r):
+                for (name, wcol), lines in zip(base_defs, row_lines):
                     draw_cell(
                         x+3,
                         y - (font_size*1.0),
-                        wcol-6,
-                        str(val) if val is not None else "",
+                        wcol,
+                        "",
                         font_name,
                         font_size,
+                        lines=lines,
+                        set_font=False,
                     )
                     x += wcol
                 y -= row_h
-                shown += 1
-                if shown >= max_rows:
-                    c.setFont("Helvetica-Oblique", 9)
-                    c.setFillColorRGB(0.25, 0.28, 0.35)
-                    c.drawString(
-                        2*cm,
-                        y,
-                        f"(Showing first {max_rows} rows. Export CSV for full dataset.)",
-                    )
-                    y -= 0.4*cm
-                    break
+
+            if len(rows) > max_rows:
+                c.setFont("Helvetica-Oblique", 9)
+                c.setFillColor(_INK_MUTED)
+                c.drawString(
+                    2*cm,
+                    y,
+                    f"(Showing first {max_rows} rows. Export CSV for full dataset.)",
+                )
+                y -= 0.4*cm
 
         # Render PDF
         header()
@@ -1,13 +1,14 @@
 # pages/superadmin_companies.py
 import os
-import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Any, Dict, List, Optional, Tuple
 
+from services.async_ui import run_async
 from services.ui_shell import PageShell
 from services.ui_theme import PALETTE as THEME_PALETTE, FONTS
 from services.firebase_client import get_db
+from services.firebase_auth import invalidate_company
 
 # ── palette (safe fallbacks) ──
 BG_APP       = THEME_PALETTE.get("bg", "#f6f7fb")
@@ -23,6 +24,14 @@ SORT_OPTIONS: List[Tuple[str, str]] = [
     ("Status (Susp.→Active)", "status_suspended_first"),
 ]
 
+# Grid card geometry (fixed size so the grid can be virtualized)
+CARD_W, CARD_H, CARD_GAP = 240, 200, 12
+CARD_ROW_H = CARD_H + 2 * CARD_GAP
+CARD_BUFFER_ROWS = 1  # extra rows rendered above/below the viewport
+
+THUMB_SIZE = (96, 96)
+COMPANIES_PAGE_SIZE = 100  # Firestore docs fetched per round trip
+
 # ────────────────────────── Optional Pillow for thumbnails ──────────────────────────
 try:
     from PIL import Image, ImageTk
@@ -44,16 +53,40 @@ def _icon_path(name: str) -> Optional[str]:
             return p
     return None
 
-def _load_img(path: Optional[str], size: Tuple[int, int]) -> Optional[tk.PhotoImage]:
+# decoded thumbnails shared across rows, keyed by (abspath, w, h)
+_IMG_BY_PATH: Dict[Tuple[str, int, int], tk.PhotoImage] = {}
+
+def _img_key(path: str, size: Tuple[int, int]) -> Tuple[str, int, int]:
+    return (os.path.abspath(path), size[0], size[1])
+
+def _decode_img(path: Optional[str], size: Tuple[int, int]):
+    """Open + resize with Pillow. Thread-safe; no Tk objects are created here."""
     if not path or not os.path.exists(path):
         return None
     if Image is None or ImageTk is None:
         return None
     try:
-        im = Image.open(path).convert("RGBA").resize(size, Image.LANCZOS)
-        return ImageTk.PhotoImage(im)
+        return Image.open(path).convert("RGBA").resize(size, Image.LANCZOS)
+    except Exception:
+        return None
+
+def _load_img(path: Optional[str], size: Tuple[int, int], decoded=None) -> Optional[tk.PhotoImage]:
+    """Tk-thread only. Pass `decoded` (from _decode_img) to skip decoding here."""
+    if not path:
+        return None
+    key = _img_key(path, size)
+    cached = _IMG_BY_PATH.get(key)
+    if cached is not None:
+        return cached
+    im = decoded if decoded is not None else _decode_img(path, size)
+    if im is None:
+        return None
+    try:
+        img = ImageTk.PhotoImage(im)
     except Exception:
         return None
+    _IMG_BY_PATH[key] = img
+    return img
 
 
 # ────────────────────────── Page ──────────────────────────
@@ -74,6 +107,18 @@ class SuperadminCompaniesPage(PageShell):
         self._selected: Optional[Dict[str, Any]] = None
         self._thumb_cache: Dict[str, tk.PhotoImage] = {}
 
+        # parallel arrays over self._all (built once per load, reused per keystroke)
+        self._names_lc: List[str] = []
+        self._actives: List[bool] = []
+        self._idx_all: List[int] = []
+        self._apply_after: Optional[str] = None
+
+        # virtualized grid: reusable card widgets + current layout
+        self._card_pool: List[tk.Frame] = []
+        self._grid_cols = 0
+        self._grid_rows = 0
+        self._visible_job: Optional[str] = None
+
         # layout
         self.content.grid_columnconfigure(0, weight=1)   # list/grid
         self.content.grid_columnconfigure(1, weight=0)   # details
@@ -210,7 +255,7 @@ class SuperadminCompaniesPage(PageShell):
         self._q = tk.StringVar()
         ent = ttk.Entry(bar, textvariable=self._q, width=30)
         ent.grid(row=0, column=3, sticky="w")
-        ent.bind("<KeyRelease>", lambda _e: self._apply_filters())
+        ent.bind("<KeyRelease>", self._on_search_key)
 
         # spacer
         tk.Frame(bar, bg=BG_SURFACE).grid(row=0, column=4, sticky="ew")
@@ -234,6 +279,19 @@ class SuperadminCompaniesPage(PageShell):
         ttk.Button(bar, text="List", style="Primary.TButton",
                    command=lambda: self._set_view("list")).grid(row=0, column=8, padx=(0, 12))
 
+    def _on_search_key(self, _e=None):
+        # coalesce a typing burst into a single filter + render pass
+        if self._apply_after:
+            try:
+                self.after_cancel(self._apply_after)
+            except Exception:
+                pass
+        self._apply_after = self.after(120, self._run_debounced_filters)
+
+    def _run_debounced_filters(self):
+        self._apply_after = None
+        self._apply_filters()
+
     def _current_sort_key(self) -> str:
         label = self._sort_label.get()
         for lab, key in SORT_OPTIONS:
@@ -249,6 +307,10 @@ class SuperadminCompaniesPage(PageShell):
     def _build_left(self, parent: tk.Widget):
         wrap = tk.Frame(parent, bg=BG_APP)
         wrap.grid(row=1, column=0, sticky="nsew")
+        self._left_wrap = wrap
+        self._list_host: Optional[tk.Frame] = None
+        self._tree: Optional[ttk.Treeview] = None
+        self._tree_rows: Dict[str, Dict[str, Any]] = {}
 
         self._canvas = tk.Canvas(wrap, bd=0, highlightthickness=0, bg=BG_APP)
         self._scroll = ttk.Scrollbar(wrap, orient="vertical", command=self._canvas.yview)
@@ -256,7 +318,11 @@ class SuperadminCompaniesPage(PageShell):
 
         self._inner.bind("<Configure>", lambda e: self._canvas.configure(scrollregion=self._canvas.bbox("all")))
         self._canvas.create_window((0, 0), window=self._inner, anchor="nw")
-        self._canvas.configure(yscrollcommand=self._scroll.set)
+        self._canvas.configure(yscrollcommand=self._on_yscroll)
+        self._canvas.bind("<Configure>", self._on_canvas_configure)
+
+        # grid mode draws into its own host so list mode can keep using pack
+        self._grid_host = tk.Frame(self._inner, bg=BG_APP)
 
         self._canvas.pack(side="left", fill="both", expand=True)
         self._scroll.pack(side="right", fill="y")
@@ -319,6 +385,30 @@ class SuperadminCompaniesPage(PageShell):
 
     # ────────────────────────── Data loading ──────────────────────────
     def _load_async(self):
+        decoded: Dict[Tuple[str, int, int], Any] = {}
+        streamed: List[Dict[str, Any]] = []
+
+        def decode_thumbs(rows: List[Dict[str, Any]]):
+            # decode thumbnails off the Tk thread; PhotoImages are made on the Tk side
+            placeholder = _icon_path("companies")
+            for r in rows:
+                p = r.get("logo_path") or placeholder
+                if not p:
+                    continue
+                key = _img_key(p, THUMB_SIZE)
+                if key not in decoded and key not in _IMG_BY_PATH:
+                    decoded[key] = _decode_img(p, THUMB_SIZE)
+
+        def on_batch(batch: List[Dict[str, Any]]):
+            # paint each page as it arrives instead of waiting for the whole collection
+            if not self.winfo_exists():
+                return
+            streamed.extend(batch)
+            self._all = streamed
+            self._index_rows(streamed)
+            self._build_thumbs(batch, decoded)
+            self._apply_filters()
+
         def work():
             db = get_db()
             rows: List[Dict[str, Any]] = []
@@ -326,156 +416,277 @@ class SuperadminCompaniesPage(PageShell):
                 if not db:
                     raise RuntimeError("No Firestore client")
 
-                # load companies only
-                docs = db.collection("companies").get()
-                for d in docs:
-                    data = d.to_dict() or {}
-                    rows.append({
-                        "id": data.get("id") or d.id,
-                        "doc_id": d.id,
-                        "name": data.get("name") or data.get("company_name") or "Company",
-                        "active": bool(data.get("active", True)),
-                        "logo_path": None,
-                    })
+                # load companies only, one page at a time (doc-id order so no doc is skipped)
+                col = db.collection("companies")
+                last = None
+                while True:
+                    q = col.order_by("__name__").limit(COMPANIES_PAGE_SIZE)
+                    if last is not None:
+                        q = q.start_after(last)
+                    docs = list(q.stream())
+                    if not docs:
+                        break
+                    batch: List[Dict[str, Any]] = []
+                    for d in docs:
+                        data = d.to_dict() or {}
+                        batch.append({
+                            "id": data.get("id") or d.id,
+                            "doc_id": d.id,
+                            "name": data.get("name") or data.get("company_name") or "Company",
+                            "active": bool(data.get("active", True)),
+                            "logo_path": None,
+                        })
+                    rows.extend(batch)
+                    decode_thumbs(batch)
+                    if len(docs) < COMPANIES_PAGE_SIZE:
+                        break
+                    try:
+                        self.after(0, lambda b=batch: on_batch(b))
+                    except Exception:
+                        pass
+                    last = docs[-1]
             except Exception:
-                # fallback demo data
-                rows = [
-                    {"id": "c01", "doc_id": "c01", "name": "Acme Logistics", "active": True,  "logo_path": None},
-                    {"id": "c02", "doc_id": "c02", "name": "North Dock",     "active": True,  "logo_path": None},
-                    {"id": "c03", "doc_id": "c03", "name": "Site Bravo",      "active": False, "logo_path": None},
-                ]
+                if not rows:
+                    # fallback demo data
+                    rows = [
+                        {"id": "c01", "doc_id": "c01", "name": "Acme Logistics", "active": True,  "logo_path": None},
+                        {"id": "c02", "doc_id": "c02", "name": "North Dock",     "active": True,  "logo_path": None},
+                        {"id": "c03", "doc_id": "c03", "name": "Site Bravo",      "active": False, "logo_path": None},
+                    ]
+                    decode_thumbs(rows)
             return rows
 
-        def done(rows: List[Dict[str, Any]]):
+        def done(rows):
+            if isinstance(rows, Exception):
+                rows = []
             self._all = rows
-            self._build_thumbs(rows)
+            self._index_rows(rows)
+            self._build_thumbs(rows, decoded)
             self._apply_filters()
 
-        threading.Thread(target=lambda: self._call_and(self, work, done), daemon=True).start()
-
-    @staticmethod
-    def _call_and(widget, fn, cb):
-        try:
-            res = fn()
-        except Exception:
-            res = []
-        try:
-            widget.after(0, lambda: cb(res))
-        except Exception:
-            pass
+        run_async(work, done, self)
 
-    def _build_thumbs(self, rows: List[Dict[str, Any]]):
+    def _build_thumbs(self, rows: List[Dict[str, Any]], decoded: Optional[Dict[Tuple[str, int, int], Any]] = None):
         placeholder = _icon_path("companies")
+        decoded = decoded or {}
         for r in rows:
             p = r.get("logo_path") or placeholder
-            img = _load_img(p, size=(96, 96))
+            if not p:
+                continue
+            img = _load_img(p, size=THUMB_SIZE, decoded=decoded.get(_img_key(p, THUMB_SIZE)))
             if img:
                 self._thumb_cache[r["id"]] = img
 
     # ────────────────────────── Filtering / sorting / rendering ──────────────────────────
+    def _index_rows(self, rows: List[Dict[str, Any]]):
+        """Precompute lowercase names + active flags so filtering skips per-row dict work."""
+        self._names_lc = [(r.get("name") or "").lower() for r in rows]
+        self._actives = [bool(r.get("active", True)) for r in rows]
+        self._idx_all = list(range(len(rows)))
+
     def _apply_filters(self):
         q = (getattr(self, "_q", tk.StringVar()).get() or "").strip().lower()
         scope = self._scope.get()
-        out: List[Dict[str, Any]] = []
+        names = self._names_lc
+        actives = self._actives
 
-        for r in self._all:
-            if q and q not in (r.get("name", "").lower()):
-                continue
-            if scope == "active" and not r.get("active", True):
-                continue
-            if scope == "suspended" and r.get("active", True):
-                continue
-            out.append(r)
+        if len(names) != len(self._all):
+            self._index_rows(self._all)
+            names, actives = self._names_lc, self._actives
+
+        want_active = (scope == "active")
+        idx = [
+            i for i in self._idx_all
+            if (not q or q in names[i]) and (scope == "all" or actives[i] == want_active)
+        ]
 
         key = self._current_sort_key()
         if key.startswith("name"):
             reverse = (key == "name_desc")
-            out.sort(key=lambda x: x.get("name", "").lower(), reverse=reverse)
+            idx.sort(key=names.__getitem__, reverse=reverse)
         else:
-            # status sorts
-            if key == "status_active_first":
-                out.sort(key=lambda x: 0 if x.get("active", True) else 1)
-            else:
-                out.sort(key=lambda x: 0 if not x.get("active", True) else 1)
-
-        self._filtered = out
+            # status sorts: two buckets, one stable O(N) pass instead of a keyed sort
+            act: List[int] = []
+            susp: List[int] = []
+            add_act, add_susp = act.append, susp.append
+            for i in idx:
+                (add_act if actives[i] else add_susp)(i)
+            idx = act + susp if key == "status_active_first" else susp + act
+
+        self._filtered = [self._all[i] for i in idx]
         self._render_cards()
 
     def _render_cards(self):
-        for w in self._inner.winfo_children():
-            w.destroy()
-
         mode = self._view_mode.get()
         if mode == "list":
+            self._show_list_host(True)
             self._render_list()
             return
+        self._show_list_host(False)
+
+        # grid: reserve space for every row, but only materialize visible cards
+        host = self._grid_host
+        if not host.winfo_manager():
+            host.pack(fill="both", expand=True)
+
+        cols = max(2, self._compute_grid_cols())
+        rows = (len(self._filtered) + cols - 1) // cols
+        for i in range(max(cols, self._grid_cols)):
+            if i < cols:
+                host.grid_columnconfigure(i, weight=1, minsize=CARD_W + 2 * CARD_GAP)
+            else:
+                host.grid_columnconfigure(i, weight=0, minsize=0)
+        for r in range(max(rows, self._grid_rows)):
+            host.grid_rowconfigure(r, minsize=(CARD_ROW_H if r < rows else 0))
+        self._grid_cols, self._grid_rows = cols, rows
 
-        # grid
-        col_count = max(2, self._compute_grid_cols())
-        for i in range(col_count):
-            self._inner.grid_columnconfigure(i, weight=1)
+        self._refresh_visible_cards()
 
-        r, c = 0, 0
-        for comp in self._filtered:
-            card = self._make_card(self._inner, comp)
-            card.grid(row=r, column=c, padx=12, pady=12, sticky="nsew")
-            c += 1
-            if c >= col_count:
-                c = 0
-                r += 1
+    def _on_yscroll(self, first, last):
+        self._scroll.set(first, last)
+        self._schedule_visible_refresh()
+
+    def _on_canvas_configure(self, _e=None):
+        if self._view_mode.get() != "grid":
+            return
+        if max(2, self._compute_grid_cols()) != self._grid_cols:
+            self._render_cards()
+        else:
+            self._schedule_visible_refresh()
+
+    def _schedule_visible_refresh(self):
+        if self._visible_job is None and self._view_mode.get() == "grid":
+            self._visible_job = self.after_idle(self._refresh_visible_cards)
+
+    def _refresh_visible_cards(self):
+        """Place pooled cards for the rows in (or near) the viewport; hide the rest."""
+        self._visible_job = None
+        if self._view_mode.get() != "grid":
+            return
+
+        cols, rows = self._grid_cols or 2, self._grid_rows
+        n = len(self._filtered)
+        start = end = 0
+        if rows:
+            top, _bottom = self._canvas.yview()
+            view_h = max(1, self._canvas.winfo_height())
+            first_row = max(0, int(top * rows) - CARD_BUFFER_ROWS)
+            last_row = min(rows, first_row + view_h // CARD_ROW_H + 1 + 2 * CARD_BUFFER_ROWS)
+            start, end = first_row * cols, min(n, last_row * cols)
+
+        needed = end - start
+        while len(self._card_pool) < needed:
+            self._card_pool.append(self._make_card(self._grid_host))
+
+        for slot, i in enumerate(range(start, end)):
+            card = self._card_pool[slot]
+            self._populate_card(card, self._filtered[i])
+            card.grid(row=i // cols, column=i % cols, padx=CARD_GAP, pady=CARD_GAP, sticky="nsew")
+        for card in self._card_pool[needed:]:
+            if card.winfo_manager():
+                card.grid_forget()
 
     def _compute_grid_cols(self) -> int:
         width = max(1, self._canvas.winfo_width() or self._inner.winfo_width() or 800)
         cols = max(2, int(width / 260))  # ~240px card + gaps
         return min(cols, 5)
 
-    def _make_card(self, parent: tk.Widget, comp: Dict[str, Any]) -> tk.Frame:
+    def _make_card(self, parent: tk.Widget) -> tk.Frame:
+        """Create an empty card; `_populate_card` fills it (cards are pooled and reused)."""
         card = tk.Frame(parent, bg=BG_SURFACE, bd=0, highlightthickness=0)
         card.grid_propagate(False)
-        card.configure(width=240, height=200)
+        card.configure(width=CARD_W, height=CARD_H)
 
-        img = self._thumb_cache.get(comp["id"])
-        thumb = tk.Label(card, image=img, bg=BG_SURFACE)
-        if img:
-            thumb.image = img
+        thumb = tk.Label(card, bg=BG_SURFACE)
         thumb.pack(padx=12, pady=(12, 8))
 
-        name = comp.get("name", "Company")
-        tk.Label(card, text=name, bg=BG_SURFACE, fg=TEXT_PRIMARY,
-                 font=("Segoe UI", 10, "bold")).pack(anchor="center")
+        name = tk.Label(card, bg=BG_SURFACE, fg=TEXT_PRIMARY, font=("Segoe UI", 10, "bold"))
+        name.pack(anchor="center")
 
         meta = tk.Frame(card, bg=BG_SURFACE)
         meta.pack(pady=(6, 8))
-        status = "Active" if comp.get("active", True) else "Suspended"
-        tk.Label(meta, text=status, bg=BG_SURFACE,
-                 fg=("#16a34a" if comp.get("active", True) else "#dc2626")).pack(side="left")
+        status = tk.Label(meta, bg=BG_SURFACE)
+        status.pack(side="left")
+
+        card._thumb, card._name, card._status = thumb, name, status
+        card._comp = None
 
         def select(_e=None):
+            comp = card._comp
+            if comp is None:
+                return
             self._selected = comp
             self._render_details(comp)
         card.bind("<Button-1>", select)
         thumb.bind("<Button-1>", select)
         return card
 
-    def _render_list(self):
-        header = tk.Frame(self._inner, bg=BG_APP)
-        header.pack(fill="x", padx=12, pady=(8, 4))
-        for txt, w in (("Name", 40), ("Status", 12)):
-            tk.Label(header, text=txt, bg=BG_APP, fg=TEXT_SECOND,
-                     width=w, anchor="w").pack(side="left")
-
-        for comp in self._filtered:
-            row = tk.Frame(self._inner, bg=BG_SURFACE)
-            row.pack(fill="x", padx=12, pady=6)
+    def _populate_card(self, card: tk.Frame, comp: Dict[str, Any]):
+        card._comp = comp
+        img = self._thumb_cache.get(comp["id"])
+        card._thumb.configure(image=img or "")
+        card._thumb.image = img
+        card._name.configure(text=comp.get("name", "Company"))
+        active = comp.get("active", True)
+        card._status.configure(
+            text=("Active" if active else "Suspended"),
+            fg=("#16a34a" if active else "#dc2626"),
+        )
 
-            tk.Label(row, text=comp.get("name", "Company"), bg=BG_SURFACE,
-                     fg=TEXT_PRIMARY, width=40, anchor="w").pack(side="left", padx=(8, 0))
-            tk.Label(row, text=("Active" if comp.get("active", True) else "Suspended"),
-                     bg=BG_SURFACE,
-                     fg=("#16a34a" if comp.get("active", True) else "#dc2626"),
-                     width=12, anchor="w").pack(side="left")
+    def _ensure_tree(self) -> ttk.Treeview:
+        if self._tree is not None:
+            return self._tree
+        host = tk.Frame(self._left_wrap, bg=BG_APP)
+        tree = ttk.Treeview(host, columns=("name", "status"), show="headings", selectmode="browse")
+        tree.heading("name", text="Name", anchor="w")
+        tree.heading("status", text="Status", anchor="w")
+        tree.column("name", width=320, anchor="w")
+        tree.column("status", width=120, anchor="w", stretch=False)
+        tree.tag_configure("active", foreground="#16a34a")
+        tree.tag_configure("suspended", foreground="#dc2626")
+
+        sb = ttk.Scrollbar(host, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=sb.set)
+        tree.pack(side="left", fill="both", expand=True, padx=(12, 0), pady=(8, 8))
+        sb.pack(side="right", fill="y", pady=(8, 8))
+
+        def _on_sel(_e=None):
+            sel = tree.selection()
+            comp = self._tree_rows.get(sel[0]) if sel else None
+            if comp is not None:
+                self._selected = comp
+                self._render_details(comp)
+        tree.bind("<<TreeviewSelect>>", _on_sel)
+
+        self._list_host, self._tree = host, tree
+        return tree
+
+    def _show_list_host(self, show: bool):
+        if show:
+            self._ensure_tree()
+            self._canvas.pack_forget()
+            self._scroll.pack_forget()
+            if not self._list_host.winfo_manager():
+                self._list_host.pack(fill="both", expand=True)
+        else:
+            if self._list_host is not None:
+                self._list_host.pack_forget()
+            if not self._canvas.winfo_manager():
+                self._canvas.pack(side="left", fill="both", expand=True)
+                self._scroll.pack(side="right", fill="y")
 
-            row.bind("<Button-1>", lambda _e, c=comp: (setattr(self, "_selected", c), self._render_details(c)))
+    def _render_list(self):
+        tree = self._ensure_tree()
+        tree.delete(*tree.get_children())
+        self._tree_rows = {}
+        for comp in self._filtered:
+            active = comp.get("active", True)
+            iid = tree.insert(
+                "", "end",
+                values=(comp.get("name", "Company"), "Active" if active else "Suspended"),
+                tags=("active" if active else "suspended",),
+            )
+            self._tree_rows[iid] = comp
 
     # ────────────────────────── Actions ──────────────────────────
     def _toggle_active(self):
@@ -488,8 +699,10 @@ class SuperadminCompaniesPage(PageShell):
         try:
             if db and doc_id:
                 db.collection("companies").document(str(doc_id)).update({"active": new_val})
+                invalidate_company(doc_id)
         except Exception:
             pass  # demo mode OK
         sel["active"] = new_val
+        self._index_rows(self._all)
         self._render_details(sel)
         self._apply_filters()
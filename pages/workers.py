@@ -1,6 +1,9 @@
 from __future__ import annotations
+import re
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 from typing import Any, Dict, List, Optional
 
 from services.ui_theme import apply_theme, card, FONTS, PALETTE
@@ -15,6 +18,30 @@ from services.workers import (
 )
 
 
+# Rows materialized in the Treeview at once; the rest are scrolled in data space.
+_WINDOW_ROWS = 20
+
+# Table columns: (key, heading, width px).
+_COLS_CFG = [
+    ("worker_id",  "Worker Id",  110),
+    ("name",       "Name",       180),
+    ("phone",      "Phone",      160),
+    ("created_at", "Created At", 160),
+    ("edit",       "Edit",        80),
+    ("delete",     "Delete",      80),
+]
+
+_CREATED_FMT = "%Y-%m-%d %H:%M"
+
+# Loaded worker list is reused for searches/Visibility for this long (seconds).
+_ROWS_TTL_S = 30.0
+
+# Characters dropped by _clean_phone (single str.translate pass).
+_PHONE_STRIP = str.maketrans("", "", " -().")
+# Optional '+', then 8–20 digits (checked on the cleaned string).
+_PHONE_DIGITS_RE = re.compile(r"\+?\d{8,20}")
+
+
 def _clean_phone(p: str) -> str:
     """
     Basic phone normalizer for validation:
@@ -25,16 +52,8 @@ def _clean_phone(p: str) -> str:
     p = (p or "").strip()
     # keep '+' only if it's the first char
     if p.startswith("+"):
-        prefix = "+"
-        rest = p[1:]
-    else:
-        prefix = ""
-        rest = p
-
-    for ch in (" ", "-", "(", ")", "."):
-        rest = rest.replace(ch, "")
-
-    return prefix + rest
+        return "+" + p[1:].translate(_PHONE_STRIP)
+    return p.translate(_PHONE_STRIP)
 
 
 def _phone_is_plausible(p: str) -> bool:
@@ -44,20 +63,151 @@ def _phone_is_plausible(p: str) -> bool:
     - after optional '+', must be digits only
     - length between 8 and 20
     """
-    p2 = _clean_phone(p)
+    if not p:
+        return False
+    return _PHONE_DIGITS_RE.fullmatch(_clean_phone(p)) is not None
 
-    if p2.startswith("+"):
-        digits = p2[1:]
+
+def _validate_worker_fields(worker_id: str, name: str, phone: str):
+    """
+    Strip + validate the worker form fields in one pass.
+    Returns ((worker_id, name, phone), None) or (None, error_message).
+    """
+    wid = (worker_id or "").strip()
+    nm = (name or "").strip()
+    ph = (phone or "").strip()
+    if not wid or not nm or not ph:
+        return None, "Please enter Worker ID, Name, and Phone."
+    if not _phone_is_plausible(ph):
+        return None, "Please enter a valid phone number with country code (e.g. +60123456789)."
+    return (wid, nm, ph), None
+
+
+def _row_values(row: Dict[str, Any]) -> tuple:
+    """Treeview values for a worker row (formatted created_at is cached on the row)."""
+    created = row.get("created_at", 0)
+    if row.get("_created_str_for") == created and "_created_str" in row:
+        created_str = row["_created_str"]
     else:
-        digits = p2
+        if created:
+            try:
+                # struct_time path: no datetime object per row
+                created_str = time.strftime(_CREATED_FMT, time.localtime(created / 1000.0))
+            except Exception:
+                created_str = str(created)
+        else:
+            created_str = "-"
+        row["_created_str"] = created_str
+        row["_created_str_for"] = created
+
+    return (
+        row["worker_id"],
+        row["name"],
+        row.get("phone", ""),
+        created_str,
+        "✏ Edit",
+        "🗑 Delete",
+    )
+
+
+def _prepare_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Precompute per-row derived data (search haystack, render signature,
+    formatted created_at) so the Tk thread only pushes values into the tree.
+    Safe to call from a worker thread.
+    """
+    for r in rows:
+        # same haystack list_workers(search=...) matches against
+        r["_search"] = f"{r['worker_id']} {r['name']} {r['phone']}".lower()
+        r["_sig"] = (r["worker_id"], r["name"], r.get("phone", ""), r.get("created_at", 0))
+        _row_values(r)
+    return rows
 
-    if not digits.isdigit():
-        return False
 
-    if len(digits) < 8 or len(digits) > 20:
-        return False
+_styles_registered = False
+
+
+def _register_styles_once():
+    """
+    ttk styles are interpreter-global, so register them on first page build only.
+    Names are prefixed with "Workers." so apply_theme() / other pages that
+    (re)configure Primary.TButton, Treeview, … don't undo them.
+    """
+    global _styles_registered
+    if _styles_registered:
+        return
+    try:
+        s = ttk.Style()
+
+        # Primary (blue) button
+        s.configure(
+            "Workers.Primary.TButton",
+            padding=(12, 6),
+            font=("Segoe UI", 10, "bold"),
+            background="#2563eb",
+            foreground="#ffffff",
+            relief="flat",
+        )
+        s.map(
+            "Workers.Primary.TButton",
+            background=[("!disabled", "#2563eb"), ("active", "#1d4ed8")],
+            foreground=[("!disabled", "#ffffff")],
+        )
+
+        # Success (green) button for Refresh
+        s.configure(
+            "Workers.Success.TButton",
+            padding=(10, 6),
+            font=("Segoe UI", 10, "bold"),
+            background="#63A361",
+            foreground="#ffffff",
+            relief="flat",
+        )
+        s.map(
+            "Workers.Success.TButton",
+            background=[("!disabled", "#63A361"), ("active", "#4e8a50")],
+            foreground=[("!disabled", "#ffffff")],
+        )
+
+        # Neutral button (used for dialog Cancel)
+        s.configure(
+            "Workers.Neutral.TButton",
+            padding=(10, 6),
+            font=("Segoe UI", 10),
+        )
+
+        # Destructive (red) button — style kept for reference
+        s.configure(
+            "Workers.Danger.TButton",
+            padding=(12, 6),
+            font=("Segoe UI", 10, "bold"),
+            background="#dc2626",
+            foreground="#ffffff",
+            relief="flat",
+        )
+        s.map(
+            "Workers.Danger.TButton",
+            background=[("!disabled", "#dc2626"), ("active", "#b91c1c")],
+            foreground=[("!disabled", "#ffffff")],
+        )
+
+        # Labels in the beige cards
+        s.configure(
+            "Workers.FormKey.TLabel",
+            background=PALETTE.get("card", "#ffffff"),
+            foreground="#333333",
+            font=("Segoe UI", 10, "bold"),
+        )
 
-    return True
+        s.configure("Workers.Treeview.Heading", font=("Segoe UI", 10, "bold"))
+        s.map(
+            "Workers.Treeview",
+            background=[("selected", "#dbeafe")],
+            foreground=[("selected", "#0f172a")],
+        )
+    except Exception:
+        return
+    _styles_registered = True
 
 
 class WorkersPage(PageShell):
@@ -75,9 +225,21 @@ class WorkersPage(PageShell):
         self.controller = controller
         apply_theme(self)
 
+        # Resolved once: pages are rebuilt on login/logout, so the session
+        # company cannot change under a live WorkersPage.
         self.company_id: Optional[Any] = getattr(self.controller, "current_company_id", None)
+        self._resolve_company_id()
         self._rows: List[Dict[str, Any]] = []
 
+        # virtualized table: only a window of rows lives in the Treeview
+        self._table_rows: List[Dict[str, Any]] = []
+        self._window_rows: List[Dict[str, Any]] = []
+        self._window_start = 0
+        self._window_size = 1
+        self._iid_pool: List[str] = []
+        self._iid_sig: Dict[str, tuple] = {}    # signature of the row each pooled iid shows
+        self._row_by_iid: Dict[str, Dict[str, Any]] = {}  # rows currently in the window
+
         # form state
         self.search_var = tk.StringVar()
         self.id_var = tk.StringVar()
@@ -90,89 +252,29 @@ class WorkersPage(PageShell):
         self._btn_refresh: Optional[ttk.Button] = None
 
         # column order (active removed)
-        self._cols: List[str] = ["worker_id", "name", "phone", "created_at", "edit", "delete"]
+        self._cols: List[str] = [key for key, _heading, _width in _COLS_CFG]
+
+        # refresh coalescing (Visibility fires several times per tab switch)
+        self._refresh_after_id: Optional[str] = None
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+
+        # unfiltered worker list from the last fetch; searches filter this in memory
+        self._all_rows: Optional[List[Dict[str, Any]]] = None
+        self._all_rows_at = 0.0
+        self._search_after_id: Optional[str] = None
+        self._name_w_for: Optional[List[Dict[str, Any]]] = None  # list the name width was measured on
 
         self._build(self.content)
-        self._refresh_async()
+        self._refresh_async_now()
         try:
-            self.bind("<Visibility>", lambda _e: self._refresh_async())
+            self.bind("<Visibility>", lambda _e: self._schedule_refresh())
         except Exception:
             pass
 
     # ───────────────────────── UI ─────────────────────────
     def _build(self, root: tk.Frame):
-        # Styles
-        try:
-            s = ttk.Style()
-
-            # Primary (blue) button
-            s.configure(
-                "Primary.TButton",
-                padding=(12, 6),
-                font=("Segoe UI", 10, "bold"),
-                background="#2563eb",
-                foreground="#ffffff",
-                relief="flat",
-            )
-            s.map(
-                "Primary.TButton",
-                background=[("!disabled", "#2563eb"), ("active", "#1d4ed8")],
-                foreground=[("!disabled", "#ffffff")],
-            )
-
-            # Success (green) button for Refresh
-            s.configure(
-                "Success.TButton",
-                padding=(10, 6),
-                font=("Segoe UI", 10, "bold"),
-                background="#63A361",
-                foreground="#ffffff",
-                relief="flat",
-            )
-            s.map(
-                "Success.TButton",
-                background=[("!disabled", "#63A361"), ("active", "#4e8a50")],
-                foreground=[("!disabled", "#ffffff")],
-            )
-
-            # Neutral button (used for dialog Cancel)
-            s.configure(
-                "Neutral.TButton",
-                padding=(10, 6),
-                font=("Segoe UI", 10),
-            )
-
-            # Destructive (red) button — style kept for reference
-            s.configure(
-                "Danger.TButton",
-                padding=(12, 6),
-                font=("Segoe UI", 10, "bold"),
-                background="#dc2626",
-                foreground="#ffffff",
-                relief="flat",
-            )
-            s.map(
-                "Danger.TButton",
-                background=[("!disabled", "#dc2626"), ("active", "#b91c1c")],
-                foreground=[("!disabled", "#ffffff")],
-            )
-
-            # Labels in the beige cards
-            s.configure(
-                "FormKey.TLabel",
-                background=PALETTE.get("card", "#ffffff"),
-                foreground="#333333",
-                font=("Segoe UI", 10, "bold"),
-            )
-
-            s.configure("Treeview.Heading", font=("Segoe UI", 10, "bold"))
-            s.map(
-                "Treeview",
-                background=[("selected", "#dbeafe")],
-                foreground=[("selected", "#0f172a")],
-            )
-        except Exception:
-            pass
+        _register_styles_once()
 
         wrap = tk.Frame(root, bg=PALETTE["bg"])
         wrap.pack(fill="both", expand=True, padx=20, pady=18)
@@ -194,8 +296,8 @@ class WorkersPage(PageShell):
         self._btn_refresh = ttk.Button(
             right,
             text="Refresh",
-            style="Success.TButton",
-            command=self._refresh_async,
+            style="Workers.Success.TButton",
+            command=self._refresh_async_now,
         )
         self._btn_refresh.pack(side="left", padx=(0, 10))
 
@@ -208,7 +310,8 @@ class WorkersPage(PageShell):
 
         ent_s = ttk.Entry(right, textvariable=self.search_var, width=24)
         ent_s.pack(side="left")
-        ent_s.bind("<Return>", lambda _e: self._refresh_async())
+        ent_s.bind("<Return>", lambda _e: self._apply_search())
+        ent_s.bind("<KeyRelease>", self._on_search_key)
 
         # Add Worker form card
         form_card, form_inner = card(wrap, pad=(16, 14))
@@ -220,7 +323,7 @@ class WorkersPage(PageShell):
         for i in range(8):
             form.grid_columnconfigure(i, weight=1 if i in (1, 3, 5) else 0)
 
-        ttk.Label(form, text="Worker ID", style="FormKey.TLabel").grid(
+        ttk.Label(form, text="Worker ID", style="Workers.FormKey.TLabel").grid(
             row=0,
             column=0,
             sticky="e",
@@ -234,7 +337,7 @@ class WorkersPage(PageShell):
             pady=8,
         )
 
-        ttk.Label(form, text="Name", style="FormKey.TLabel").grid(
+        ttk.Label(form, text="Name", style="Workers.FormKey.TLabel").grid(
             row=0,
             column=2,
             sticky="e",
@@ -248,7 +351,7 @@ class WorkersPage(PageShell):
             pady=8,
         )
 
-        ttk.Label(form, text="Phone (+60…)", style="FormKey.TLabel").grid(
+        ttk.Label(form, text="Phone (+60…)", style="Workers.FormKey.TLabel").grid(
             row=0,
             column=4,
             sticky="e",
@@ -265,7 +368,7 @@ class WorkersPage(PageShell):
         ttk.Button(
             form,
             text="Add Worker",
-            style="Primary.TButton",
+            style="Workers.Primary.TButton",
             command=self._on_add,
         ).grid(
             row=0,
@@ -296,41 +399,42 @@ class WorkersPage(PageShell):
         self._status_lbl.pack(side="right")
 
         # Treeview without Active column
+        tree_wrap = tk.Frame(table_inner, bg=PALETTE["card"])
+        tree_wrap.pack(fill="x", padx=10, pady=10)
+
         tree = ttk.Treeview(
-            table_inner,
+            tree_wrap,
             columns=self._cols,
             show="headings",
             height=1,  # we'll resize based on rows later
+            style="Workers.Treeview",
         )
-        tree.pack(fill="x", padx=10, pady=10)
-
-        headings = {
-            "worker_id": "Worker Id",
-            "name": "Name",
-            "phone": "Phone",
-            "created_at": "Created At",
-            "edit": "Edit",
-            "delete": "Delete",
-        }
-
-        for key in self._cols:
-            tree.heading(key, text=headings[key], anchor="center")
-            tree.column(key, anchor="center")
-
-        # set widths
-        tree.column("worker_id", width=110)
-        tree.column("name", width=180)
-        tree.column("phone", width=160)
-        tree.column("created_at", width=160)
-        tree.column("edit", width=80)
-        tree.column("delete", width=80)
+        vsb = ttk.Scrollbar(tree_wrap, orient="vertical", command=self._on_scrollbar)
+        tree.pack(side="left", fill="x", expand=True)
+        vsb.pack(side="right", fill="y")
+        self._vsb = vsb
+
+        for key, heading, width in _COLS_CFG:
+            tree.heading(key, text=heading, anchor="center")
+            tree.column(key, anchor="center", width=width, stretch=False)
 
         # click handling for in-table actions
         tree.bind("<Button-1>", self._on_tree_click)
         tree.bind("<Double-1>", self._on_tree_double)
 
+        # scrolling moves the data window, not the widget
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tree.bind(seq, self._on_wheel)
+
         self.tree = tree
 
+        # Color rows (always same light green style now)
+        tree.tag_configure(
+            "row_active",
+            background="#ecfdf5",   # light green bg
+            foreground="#065f46",   # dark green text
+        )
+
     # ───────────────────────── actions ─────────────────────────
     def _on_tree_click(self, event):
         """Handle clicks on Edit/Delete columns."""
@@ -346,11 +450,7 @@ class WorkersPage(PageShell):
             return
         col_name = self._cols[col_index]
 
-        row = None
-        for r in self._rows:
-            if r.get("_iid") == row_iid:
-                row = r
-                break
+        row = self._row_by_iid.get(row_iid)
         if not row:
             return
 
@@ -371,11 +471,7 @@ class WorkersPage(PageShell):
         sel = self.tree.selection()
         if not sel:
             return None
-        iid = sel[0]
-        for r in self._rows:
-            if r.get("_iid") == iid:
-                return r
-        return None
+        return self._row_by_iid.get(sel[0])
 
     def _open_edit_dialog(self, row: Dict[str, Any]):
         top = tk.Toplevel(self)
@@ -440,35 +536,25 @@ class WorkersPage(PageShell):
         ttk.Button(
             btns,
             text="Save",
-            style="Primary.TButton",
+            style="Workers.Primary.TButton",
             command=lambda: _save(),
         ).pack(side="left")
 
         ttk.Button(
             btns,
             text="Cancel",
-            style="Neutral.TButton",
+            style="Workers.Neutral.TButton",
             command=lambda: top.destroy(),
         ).pack(side="right")
 
         def _save():
-            new_name = (name_var.get() or "").strip()
-            new_id = (worker_id_var.get() or "").strip()
-            new_phone = (phone_var.get() or "").strip()
-
-            # validation
-            if not new_id or not new_name or not new_phone:
-                messagebox.showerror(
-                    "Edit",
-                    "Worker ID, Name, and Phone are required.",
-                )
-                return
-            if not _phone_is_plausible(new_phone):
-                messagebox.showerror(
-                    "Edit",
-                    "Please enter a valid phone number with country code (e.g. +60123456789).",
-                )
+            fields, err = _validate_worker_fields(
+                worker_id_var.get(), name_var.get(), phone_var.get()
+            )
+            if err:
+                messagebox.showerror("Edit", err)
                 return
+            new_id, new_name, new_phone = fields
 
             def _work():
                 update_worker(
@@ -498,7 +584,7 @@ class WorkersPage(PageShell):
                     "Worker details updated.",
                 )
 
-                self._refresh_async()
+                self._refresh_async_now()
 
             run_async(_work, _done, self)
 
@@ -527,7 +613,7 @@ class WorkersPage(PageShell):
                 "Worker deleted.",
             )
 
-            self._refresh_async()
+            self._refresh_async_now()
 
         run_async(_work, _done, self)
 
@@ -540,26 +626,17 @@ class WorkersPage(PageShell):
             except Exception:
                 self.company_id = getattr(self.controller, "current_company_id", None)
 
-        worker_id = (self.id_var.get() or "").strip()
-        name = (self.name_var.get() or "").strip()
-        phone = (self.phone_var.get() or "").strip()
-
         # validation
         if not self.company_id:
             messagebox.showerror("Workers", "No company selected.")
             return
-        if not worker_id or not name or not phone:
-            messagebox.showerror(
-                "Workers",
-                "Please enter Worker ID, Name, and Phone.",
-            )
-            return
-        if not _phone_is_plausible(phone):
-            messagebox.showerror(
-                "Workers",
-                "Please enter a valid phone number with country code (e.g. +60123456789).",
-            )
+        fields, err = _validate_worker_fields(
+            self.id_var.get(), self.name_var.get(), self.phone_var.get()
+        )
+        if err:
+            messagebox.showerror("Workers", err)
             return
+        worker_id, name, phone = fields
 
         def _work():
             return create_worker(self.company_id, worker_id, name, phone)
@@ -583,13 +660,13 @@ class WorkersPage(PageShell):
                 "Worker added successfully.",
             )
 
-            self._refresh_async()
+            self._refresh_async_now()
 
         run_async(_work, _done, self)
 
     # ───────────────────────── data refresh ─────────────────────────
-    def _refresh_async(self):
-        # Always re-resolve company each refresh to avoid stale context
+    def _resolve_company_id(self):
+        """Session company first, controller context as fallback."""
         try:
             sess_user = require_user()
             self.company_id = sess_user.get("company_id") or self.company_id
@@ -598,30 +675,75 @@ class WorkersPage(PageShell):
         if not self.company_id:
             self.company_id = getattr(self.controller, "current_company_id", None)
 
+    def _schedule_refresh(self, delay_ms: int = 250):
+        """Collapse bursts of refresh triggers into a single fetch."""
+        if self._refresh_after_id is not None:
+            try:
+                self.after_cancel(self._refresh_after_id)
+            except Exception:
+                pass
+        self._refresh_after_id = self.after(delay_ms, self._fetch_if_stale)
+
+    def _fetch_if_stale(self):
+        """Hit the backend only if nothing is loaded yet or the list is older than the TTL."""
+        self._refresh_after_id = None
+        if self._all_rows is None or time.monotonic() - self._all_rows_at > _ROWS_TTL_S:
+            self._refresh_async_now()
+        else:
+            self._apply_search()
+
+    def _on_search_key(self, event=None):
+        if event is not None and getattr(event, "keysym", "") == "Return":
+            return  # handled by the <Return> binding
+        if self._search_after_id is not None:
+            try:
+                self.after_cancel(self._search_after_id)
+            except Exception:
+                pass
+        self._search_after_id = self.after(150, self._apply_search)
+
+    def _apply_search(self):
+        """Filter the cached worker list by the search box (worker_id / name / phone)."""
+        self._search_after_id = None
+        if self._all_rows is None:
+            self._fetch_if_stale()
+            return
+        needle = (self.search_var.get() or "").strip().lower()
+        if needle:
+            rows = [r for r in self._all_rows if needle in r["_search"]]
+        else:
+            rows = self._all_rows
+        self._rows = rows
+        self._render_table(rows)
+        if self._status_lbl:
+            self._status_lbl.config(text=f"{len(rows)} worker(s)")
+
+    def _refresh_async_now(self):
+        self._refresh_after_id = None
+        if self._refresh_in_flight:
+            # one fetch at a time; re-run once the current one lands
+            self._refresh_pending = True
+            return
+
+        if not self.company_id:
+            self._resolve_company_id()
+
         if not self.company_id:
             self._rows = []
             self._render_table([])
             return
 
-        search = (self.search_var.get() or "").strip()
-
-        if self._status_lbl:
-            self._status_lbl.config(text="Loading…")
-        if self._btn_refresh:
-            try:
-                self._btn_refresh.config(state="disabled")
-            except Exception:
-                pass
+        self.after_idle(lambda: self._set_loading_ui(True))
 
         def _work():
-            return list_workers(self.company_id, search=search)
+            return _prepare_rows(list_workers(self.company_id))
 
         def _done(result):
-            try:
-                if self._btn_refresh:
-                    self._btn_refresh.config(state="normal")
-            except Exception:
-                pass
+            self._refresh_in_flight = False
+            if self._refresh_pending:
+                self._refresh_pending = False
+                self.after(0, self._refresh_async_now)
+            self.after_idle(lambda: self._set_loading_ui(False))
 
             if isinstance(result, Exception):
                 if self._status_lbl:
@@ -632,61 +754,133 @@ class WorkersPage(PageShell):
                 )
                 return
 
-            self._rows = result
-            self._render_table(self._rows)
-            if self._status_lbl:
-                self._status_lbl.config(text=f"{len(self._rows)} worker(s)")
+            self._all_rows = result
+            self._all_rows_at = time.monotonic()
+            self._apply_search()
 
+        self._refresh_in_flight = True
         run_async(_work, _done, self)
 
+    def _set_loading_ui(self, on: bool):
+        """Toggle the Loading… label + Refresh button together (run via after_idle)."""
+        if on and self._status_lbl:
+            self._status_lbl.config(text="Loading…")
+        if self._btn_refresh:
+            try:
+                self._btn_refresh.config(state="disabled" if on else "normal")
+            except Exception:
+                pass
+
     def _render_table(self, rows: List[Dict[str, Any]]):
         if not self.tree:
             return
         tree = self.tree
 
-        # clear old rows
-        for r in tree.get_children():
-            tree.delete(r)
-
-        # insert fresh rows
-        for row in rows:
-            created = row.get("created_at", 0)
-            if created:
-                try:
-                    import datetime as _dt
-                    dt = _dt.datetime.fromtimestamp(created / 1000.0)
-                    created_str = dt.strftime("%Y-%m-%d %H:%M")
-                except Exception:
-                    created_str = str(created)
-            else:
-                created_str = "-"
-
-            vals = (
-                row["worker_id"],
-                row["name"],
-                row.get("phone", ""),
-                created_str,
-                "✏ Edit",
-                "🗑 Delete",
-            )
-
-            iid = tree.insert("", "end", values=vals)
-
-            # Color row (always same light green style now)
+        # keep the same worker at the top of the window across refreshes
+        anchor = self._window_rows[0].get("doc_id") if self._window_rows else None
+        if anchor is not None:
+            for i, r in enumerate(rows):
+                if r.get("doc_id") == anchor:
+                    self._window_start = i
+                    break
+
+        self._fit_name_column()
+        self._table_rows = rows
+        size = max(1, min(len(rows), _WINDOW_ROWS))
+        if size != self._window_size:
             try:
-                tree.item(iid, tags=("row_active",))
-                tree.tag_configure(
-                    "row_active",
-                    background="#ecfdf5",   # light green bg
-                    foreground="#065f46",   # dark green text
-                )
+                tree.configure(height=size)
             except Exception:
                 pass
-
-            row["_iid"] = iid
-
-        # auto-fit height to however many rows we have
+            self._window_size = size
+        self._window_start = max(0, min(self._window_start, len(rows) - size))
+        self._fill_window()
+
+    def _fit_name_column(self):
+        """Size the Name column once per fetched list (not per row/search)."""
+        src = self._all_rows
+        if not self.tree or not src or src is self._name_w_for:
+            return
+        self._name_w_for = src
         try:
-            tree.configure(height=max(1, len(rows)))
+            measure = tkfont.nametofont("TkDefaultFont").measure
+            max_px = max(measure(n) for n in {r["name"] for r in src})
+            self.tree.column("name", width=max(_COLS_CFG[1][2], max_px + 16), stretch=False)
         except Exception:
             pass
+
+    def _fill_window(self):
+        """Show rows[start:start+size] by re-using a fixed pool of Treeview items."""
+        tree = self.tree
+        if not tree:
+            return
+        start = self._window_start
+        visible = self._table_rows[start:start + self._window_size]
+
+        # selection follows the worker (doc_id), not the pooled iid
+        selected = set(tree.selection())
+        sel_docs = {self._row_by_iid[i].get("doc_id") for i in selected if i in self._row_by_iid}
+
+        pool = self._iid_pool
+        while len(pool) < len(visible):
+            pool.append(tree.insert("", "end", values=(), tags=("row_active",)))
+        while len(pool) > len(visible):
+            iid = pool.pop()
+            self._iid_sig.pop(iid, None)
+            tree.delete(iid)
+
+        for row in self._window_rows:
+            row.pop("_iid", None)
+        self._row_by_iid = {}
+
+        keep_sel = []
+        for iid, row in zip(pool, visible):
+            # the cell values derive only from these fields; when the slot already
+            # shows the same signature, skip building values and the Tcl call
+            sig = row.get("_sig")
+            if sig is None:
+                sig = (row["worker_id"], row["name"], row.get("phone", ""), row.get("created_at", 0))
+                row["_sig"] = sig
+            if self._iid_sig.get(iid) != sig:
+                tree.item(iid, values=_row_values(row))
+                self._iid_sig[iid] = sig
+            row["_iid"] = iid
+            self._row_by_iid[iid] = row
+            if row.get("doc_id") in sel_docs:
+                keep_sel.append(iid)
+
+        if set(keep_sel) != selected:
+            tree.selection_set(keep_sel)
+
+        self._window_rows = visible
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        n = len(self._table_rows)
+        if n <= 0:
+            self._vsb.set(0.0, 1.0)
+            return
+        start = self._window_start
+        self._vsb.set(start / n, min(1.0, (start + self._window_size) / n))
+
+    def _scroll_to(self, start: int):
+        max_start = max(0, len(self._table_rows) - self._window_size)
+        start = max(0, min(int(start), max_start))
+        if start == self._window_start:
+            return
+        self._window_start = start
+        self._fill_window()
+
+    def _on_scrollbar(self, action: str, *args):
+        if action == "moveto":
+            self._scroll_to(float(args[0]) * len(self._table_rows))
+        elif action == "scroll":
+            step = self._window_size if args[1] == "pages" else 1
+            self._scroll_to(self._window_start + int(args[0]) * step)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self._window_start - 3)
+        else:
+            self._scroll_to(self._window_start + 3)
+        return "break"
@@ -1,11 +1,24 @@
 # pages/zones.py
 from __future__ import annotations
+import functools
+import re
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
+try:  # optional: vectorized online debounce for large fleets
+    import numpy as np
+except ImportError:
+    np = None
+
+try:  # optional C ISO-8601 parser; handles "Z"/offsets natively
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = None
+
 from services.ui_theme import apply_theme, card, FONTS, PALETTE
 from services.ui_shell import PageShell
 from services.session import require_user
@@ -16,9 +29,10 @@ from services.zones import (
     update_zone,
     delete_zone,
     list_cameras_by_zone,
-    list_cameras_by_company,  # ← added: fetch all cameras once
+    list_cameras_by_company_grouped,  # all cameras once, bucketed by zone
+    CameraRecord,
     create_camera,
-    delete_camera,
+    delete_cameras_by_zone,
     update_camera,
     ALLOWED_SCHEMES,
     MAX_URL_LEN,
@@ -30,8 +44,17 @@ MODE_VALUES = ["Monitor", "Entry"]
 
 # ↓ make refresh less spammy (was 2_000)
 AUTO_REFRESH_MS = 5_000
+REFRESH_DEBOUNCE_MS = 300   # Visibility/timer/wizard bursts collapse into one fetch
 ONLINE_MAX_AGE_SEC = 60
 REQUIRED_STREAK = 2
+VECTOR_MIN_CAMS = 64  # below this the scalar debounce loop is cheaper than numpy setup
+
+# backend errors that mean the session/credentials went stale
+_AUTH_ERRORS = frozenset({"PermissionDenied", "Unauthenticated", "PermissionError"})
+
+_WHITESPACE_RE = re.compile(r"\s")
+_ALLOWED_SCHEMES = frozenset(ALLOWED_SCHEMES)
+_ALLOWED_TEXT = ", ".join(sorted(_ALLOWED_SCHEMES))
 
 # ───────────────── theme (match Add Admin) ─────────────────
 PAGE_BG = "#E6D8C3"
@@ -52,32 +75,54 @@ TAG_OFFLINE_BG = "#FDECEA"
 TAG_OFFLINE_FG = "#991B1B"
 TAG_ALT_BG = "#F7F1E6"
 
+# indexed by the online bool; text/tag are only materialized for the tree
+_STATUS_STR = ("● Offline", "● Online")
+_STATUS_TAG = ("row-offline", "row-online")
+
+_CHIP_FONT = ("Segoe UI Semibold", 9)
+_CHIP_STYLES = {
+    "online": dict(bg=TAG_ONLINE_BG, fg=TAG_ONLINE_FG, padx=10, pady=4, font=_CHIP_FONT),
+    "offline": dict(bg=TAG_OFFLINE_BG, fg=TAG_OFFLINE_FG, padx=10, pady=4, font=_CHIP_FONT),
+}
+
+
+_RISK_STORE = {"low": "low", "med": "med", "medium": "med", "high": "high"}
+_RISK_DISPLAY = {"low": "Low", "med": "Medium", "high": "High"}
+_MODE_STORE = {"monitor": "monitor", "entry": "entry"}
+_MODE_DISPLAY = {"monitor": "Monitor", "entry": "Entry"}
+
+# exact-match hits for the values we actually see (stored + combobox text),
+# so the common case skips strip()/lower()
+_RISK_STORE_FAST = {**_RISK_STORE, "Low": "low", "Medium": "med", "High": "high"}
+_RISK_DISPLAY_FAST = {**_RISK_DISPLAY, "Low": "Low", "Medium": "Medium", "High": "High"}
+_MODE_STORE_FAST = {**_MODE_STORE, "Monitor": "monitor", "Entry": "entry"}
+_MODE_DISPLAY_FAST = {**_MODE_DISPLAY, "Monitor": "Monitor", "Entry": "Entry"}
 
 def _risk_to_store(v: str) -> str:
-    x = (v or "").strip().lower()
-    if x in ("low",):
-        return "low"
-    if x in ("med", "medium"):
-        return "med"
-    if x in ("high",):
-        return "high"
-    return "med"
+    hit = _RISK_STORE_FAST.get(v)
+    if hit is not None:
+        return hit
+    return _RISK_STORE.get((v or "").strip().lower(), "med")
 
 def _risk_to_display(v: str) -> str:
-    x = (v or "").strip().lower()
-    return {"low": "Low", "med": "Medium", "high": "High"}.get(x, (v or "").strip().title() or "Medium")
+    hit = _RISK_DISPLAY_FAST.get(v)
+    if hit is not None:
+        return hit
+    x = (v or "").strip()
+    return _RISK_DISPLAY.get(x.lower()) or x.title() or "Medium"
 
 def _mode_to_store(v: str) -> str:
-    x = (v or "").strip().lower()
-    if x in ("monitor",):
-        return "monitor"
-    if x in ("entry",):
-        return "entry"
-    return "monitor"
+    hit = _MODE_STORE_FAST.get(v)
+    if hit is not None:
+        return hit
+    return _MODE_STORE.get((v or "").strip().lower(), "monitor")
 
 def _mode_to_display(v: str) -> str:
-    x = (v or "").strip().lower()
-    return {"monitor": "Monitor", "entry": "Entry"}.get(x, (v or "").strip().title() or "Monitor")
+    hit = _MODE_DISPLAY_FAST.get(v)
+    if hit is not None:
+        return hit
+    x = (v or "").strip()
+    return _MODE_DISPLAY.get(x.lower()) or x.title() or "Monitor"
 
 
 def _to_epoch_seconds(ts: Any) -> Optional[float]:
@@ -96,24 +141,67 @@ def _to_epoch_seconds(ts: Any) -> Optional[float]:
         except Exception:
             pass
     if isinstance(ts, str):
+        return _iso_to_epoch(ts)
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _iso_to_epoch(ts: str) -> Optional[float]:
+    # heartbeat strings repeat across polls; keyed on the raw string
+    if _parse_iso is not None:
         try:
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+            dt = _parse_iso(ts)
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
             return dt.timestamp()
         except Exception:
             pass
+    try:
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except Exception:
+        return None
+
+_FRESH_KEYS = ("last_heartbeat", "last_seen", "last_ping")
+
+def _heartbeat_epoch(cam: CameraRecord, key_cache: Optional[Dict[str, str]] = None,
+                     cam_id: str = "") -> Optional[float]:
+    # a camera backend keeps filling the same field; try last time's winner first
+    if key_cache is not None:
+        key = key_cache.get(cam_id)
+        if key:
+            ts = _to_epoch_seconds(getattr(cam, key))
+            if ts is not None:
+                return ts
+    for key in _FRESH_KEYS:
+        ts = _to_epoch_seconds(getattr(cam, key))
+        if ts is not None:
+            if key_cache is not None:
+                key_cache[cam_id] = key
+            return ts
     return None
 
-def _camera_fresh(cam: Dict[str, Any]) -> bool:
-    now = datetime.now(tz=timezone.utc).timestamp()
-    for key in ("last_heartbeat", "last_seen", "last_ping"):
-        age = _to_epoch_seconds(cam.get(key))
-        if age is not None:
-            return (now - age) <= ONLINE_MAX_AGE_SEC
-    if "online" in cam:
-        return bool(cam.get("online"))
-    return False
+def _camera_fresh(cam: CameraRecord, now_ts: float,
+                  key_cache: Optional[Dict[str, str]] = None, cam_id: str = "") -> bool:
+    ts = _heartbeat_epoch(cam, key_cache, cam_id)
+    if ts is not None:
+        return (now_ts - ts) <= ONLINE_MAX_AGE_SEC
+    return bool(cam.online)
+
+def _snapshot_sig(zones: List[Dict[str, Any]], cam_by_zone: Dict[str, List[CameraRecord]],
+                  now_ts: float, key_cache: Dict[str, str]) -> tuple:
+    """Everything the table shows, reduced to a comparable tuple (freshness included)."""
+    out = []
+    for z in zones:
+        cams = cam_by_zone.get(z["id"])
+        cam_sig = None
+        if cams:
+            c = cams[0]
+            cam_sig = (len(cams), c.id, c.name, c.mode,
+                       _camera_fresh(c, now_ts, key_cache, str(c.id or c.name or "")))
+        out.append((z["id"], z.get("name"), z.get("risk_level"), z.get("description"), cam_sig))
+    return tuple(out)
 
 def _validate_rtsp_for_ui(text: str) -> Optional[str]:
     u = (text or "").strip()
@@ -121,12 +209,15 @@ def _validate_rtsp_for_ui(text: str) -> Optional[str]:
         return "RTSP / Source is required."
     if len(u) > MAX_URL_LEN:
         return f"Source URL is too long (>{MAX_URL_LEN} characters)."
-    if any(ch.isspace() for ch in u):
+    if _WHITESPACE_RE.search(u):
         return "Source URL must not contain spaces."
+    # cheap scheme check before paying for the full parser
+    scheme, sep, _rest = u.partition("://")
+    if sep and scheme.lower() not in _ALLOWED_SCHEMES:
+        return f"Unsupported URL scheme '{scheme.lower()}'. Allowed: {_ALLOWED_TEXT}."
     p = urlparse(u)
-    if (p.scheme or "").lower() not in ALLOWED_SCHEMES:
-        allowed = ", ".join(sorted(ALLOWED_SCHEMES))
-        return f"Unsupported URL scheme '{p.scheme}'. Allowed: {allowed}."
+    if (p.scheme or "").lower() not in _ALLOWED_SCHEMES:
+        return f"Unsupported URL scheme '{p.scheme}'. Allowed: {_ALLOWED_TEXT}."
     if not p.netloc:
         return "Source URL must include a host (e.g., rtsp://host/stream)."
     if p.path is None or len(p.path) == 0:
@@ -134,6 +225,59 @@ def _validate_rtsp_for_ui(text: str) -> Optional[str]:
     return None
 
 
+def _entry_focus_in(event):
+    event.widget.configure(bg="#FFFFFF")
+
+def _entry_focus_out(event):
+    event.widget.configure(bg=ENTRY_BG)
+
+
+_styles_registered = False
+
+
+def _register_styles_once():
+    """
+    ttk styles are interpreter-global, so register them on first use only.
+    Names are prefixed with "Zones." so apply_theme() / other pages that
+    (re)configure Primary.TButton, Admin.Treeview, … don't undo them.
+    """
+    global _styles_registered
+    if _styles_registered:
+        return
+    try:
+        s = ttk.Style()
+        s.configure("Zones.Primary.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
+                    background=PRIMARY, foreground="white", borderwidth=0, relief="flat")
+        s.map("Zones.Primary.TButton", background=[("active", PRIMARY_HOVER)], relief=[("pressed", "sunken")])
+
+        s.configure("Zones.Success.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
+                    background=SUCCESS, foreground="white", borderwidth=0, relief="flat")
+        s.map("Zones.Success.TButton", background=[("active", SUCCESS_HOVER)], relief=[("pressed", "sunken")])
+
+        s.configure("Zones.Danger.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
+                    background=DANGER, foreground="white", borderwidth=0, relief="flat")
+        s.map("Zones.Danger.TButton", background=[("active", DANGER_HOVER)], relief=[("pressed", "sunken")])
+
+        s.configure("Zones.Treeview",
+                    background=CARD_BG, fieldbackground=CARD_BG, foreground=TEXT_FG,
+                    rowheight=28, borderwidth=0)
+        s.configure("Zones.Treeview.Heading",
+                    font=("Segoe UI Semibold", 10), foreground=TEXT_FG, background=CARD_BG, padding=(10, 8))
+
+        s.configure("Zones.FormKey.TLabel", background=CARD_BG, foreground="#333333", font=("Segoe UI", 10, "bold"))
+
+        s.configure("Zones.Warm.TCombobox",
+                    fieldbackground=ENTRY_BG, background=ENTRY_BG, foreground=TEXT_FG, arrowcolor=TEXT_FG)
+        s.map("Zones.Warm.TCombobox",
+              fieldbackground=[("readonly", ENTRY_BG), ("!disabled", ENTRY_BG), ("active", ENTRY_BG)],
+              foreground=[("readonly", TEXT_FG)],
+              background=[("readonly", ENTRY_BG), ("!disabled", ENTRY_BG), ("active", ENTRY_BG)],
+              arrowcolor=[("readonly", TEXT_FG), ("!disabled", TEXT_FG), ("active", TEXT_FG)])
+    except Exception:
+        return
+    _styles_registered = True
+
+
 # ───────────────── ZoneWizard ─────────────────
 class ZoneWizard(tk.Toplevel):
     def __init__(self, master, *, company_id: str, on_done):
@@ -163,6 +307,7 @@ class ZoneWizard(tk.Toplevel):
 
         apply_theme(self)
         self._init_styles()
+        _register_styles_once()
         self._build()
 
     def _init_styles(self):
@@ -181,28 +326,6 @@ class ZoneWizard(tk.Toplevel):
             self.option_add(f"{prefix}.selectForeground", "#FFFFFF")
             self.option_add(f"{prefix}.highlightBackground", ENTRY_BG)
 
-        s = ttk.Style(self)
-        s.configure("Primary.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
-                    background=PRIMARY, foreground="white", borderwidth=0, relief="flat")
-        s.map("Primary.TButton", background=[("active", PRIMARY_HOVER)], relief=[("pressed", "sunken")])
-
-        s.configure("Danger.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
-                    background=DANGER, foreground="white", borderwidth=0, relief="flat")
-        s.map("Danger.TButton", background=[("active", DANGER_HOVER)], relief=[("pressed", "sunken")])
-
-        s.configure("Warm.TCombobox",
-                    fieldbackground=ENTRY_BG,
-                    background=ENTRY_BG,
-                    foreground=TEXT_FG,
-                    arrowcolor=TEXT_FG)
-        s.map("Warm.TCombobox",
-              fieldbackground=[("readonly", ENTRY_BG), ("!disabled", ENTRY_BG), ("active", ENTRY_BG)],
-              foreground=[("readonly", TEXT_FG)],
-              background=[("readonly", ENTRY_BG), ("!disabled", ENTRY_BG), ("active", ENTRY_BG)],
-              arrowcolor=[("readonly", TEXT_FG), ("!disabled", TEXT_FG), ("active", TEXT_FG)])
-
-        s.configure("FormKey.TLabel", background=CARD_BG, foreground="#333333", font=("Segoe UI", 10, "bold"))
-
     def _make_entry(self, parent, show: str | None = None) -> tk.Entry:
         e = tk.Entry(parent, bg=ENTRY_BG, fg=TEXT_FG, insertbackground=TEXT_FG,
                      relief="flat", highlightthickness=1,
@@ -210,8 +333,8 @@ class ZoneWizard(tk.Toplevel):
                      font=("Segoe UI", 10))
         if show:
             e.config(show=show)
-        e.bind("<FocusIn>", lambda _e: e.configure(bg="#FFFFFF"))
-        e.bind("<FocusOut>", lambda _e: e.configure(bg=ENTRY_BG))
+        e.bind("<FocusIn>", _entry_focus_in)
+        e.bind("<FocusOut>", _entry_focus_out)
         return e
 
     def _build(self):
@@ -229,31 +352,31 @@ class ZoneWizard(tk.Toplevel):
         form.grid_columnconfigure(0, weight=0)
         form.grid_columnconfigure(1, weight=1)
 
-        ttk.Label(form, text="Zone Name", style="FormKey.TLabel").grid(row=0, column=0, sticky="e", padx=(0, 10), pady=6)
+        ttk.Label(form, text="Zone Name", style="Zones.FormKey.TLabel").grid(row=0, column=0, sticky="e", padx=(0, 10), pady=6)
         self.z_name = self._make_entry(form); self.z_name.grid(row=0, column=1, sticky="ew", pady=6)
 
-        ttk.Label(form, text="Risk Level", style="FormKey.TLabel").grid(row=1, column=0, sticky="e", padx=(0, 10), pady=6)
-        self.z_risk = ttk.Combobox(form, values=RISK_VALUES, state="readonly", style="Warm.TCombobox")
+        ttk.Label(form, text="Risk Level", style="Zones.FormKey.TLabel").grid(row=1, column=0, sticky="e", padx=(0, 10), pady=6)
+        self.z_risk = ttk.Combobox(form, values=RISK_VALUES, state="readonly", style="Zones.Warm.TCombobox")
         self.z_risk.set("Medium"); self.z_risk.grid(row=1, column=1, sticky="w", pady=6)
 
-        ttk.Label(form, text="Description", style="FormKey.TLabel").grid(row=2, column=0, sticky="e", padx=(0, 10), pady=6)
+        ttk.Label(form, text="Description", style="Zones.FormKey.TLabel").grid(row=2, column=0, sticky="e", padx=(0, 10), pady=6)
         self.z_desc = self._make_entry(form); self.z_desc.grid(row=2, column=1, sticky="ew", pady=6)
 
         ttk.Separator(form, orient="horizontal").grid(row=3, column=0, columnspan=2, sticky="ew", pady=(10, 8))
 
-        ttk.Label(form, text="Camera Name", style="FormKey.TLabel").grid(row=4, column=0, sticky="e", padx=(0, 10), pady=6)
+        ttk.Label(form, text="Camera Name", style="Zones.FormKey.TLabel").grid(row=4, column=0, sticky="e", padx=(0, 10), pady=6)
         self.cam_name = self._make_entry(form); self.cam_name.grid(row=4, column=1, sticky="ew", pady=6)
 
-        ttk.Label(form, text="RTSP / Source", style="FormKey.TLabel").grid(row=5, column=0, sticky="e", padx=(0, 10), pady=6)
+        ttk.Label(form, text="RTSP / Source", style="Zones.FormKey.TLabel").grid(row=5, column=0, sticky="e", padx=(0, 10), pady=6)
         self.cam_rtsp = self._make_entry(form); self.cam_rtsp.grid(row=5, column=1, sticky="ew", pady=6)
 
-        ttk.Label(form, text="Mode", style="FormKey.TLabel").grid(row=6, column=0, sticky="e", padx=(0, 10), pady=6)
-        self.cam_mode = ttk.Combobox(form, values=MODE_VALUES, state="readonly", style="Warm.TCombobox")
+        ttk.Label(form, text="Mode", style="Zones.FormKey.TLabel").grid(row=6, column=0, sticky="e", padx=(0, 10), pady=6)
+        self.cam_mode = ttk.Combobox(form, values=MODE_VALUES, state="readonly", style="Zones.Warm.TCombobox")
         self.cam_mode.set("Monitor"); self.cam_mode.grid(row=6, column=1, sticky="w", pady=6)
 
         foot = tk.Frame(wrapper, bg=PAGE_BG); foot.pack(fill="x", pady=(12, 0))
-        ttk.Button(foot, text="← Cancel", style="Danger.TButton", command=self.destroy).pack(side="left")
-        self._save_btn = ttk.Button(foot, text="Save", style="Primary.TButton", command=self._save)
+        ttk.Button(foot, text="← Cancel", style="Zones.Danger.TButton", command=self.destroy).pack(side="left")
+        self._save_btn = ttk.Button(foot, text="Save", style="Zones.Primary.TButton", command=self._save)
         self._save_btn.pack(side="right")
 
     def _save(self):
@@ -343,55 +466,36 @@ class ZonesPage(PageShell):
             self.option_add(f"{prefix}.highlightBackground", ENTRY_BG)
 
         self.company_id: Optional[str] = None
+        self._auth_retried = False
         self._zones: List[Dict[str, Any]] = []
         self._refresh_job: Optional[str] = None
-        self._streaks: Dict[str, int] = {}
-        self._decision: Dict[str, bool] = {}
+        self._refresh_inflight = False
+        self._last_refresh_ts = 0.0
+        self._refresh_trailing: Optional[str] = None
+        self._reset_online_state()
+        # zone_id -> (iid, (values, tags)) as last written to the tree
+        self._row_index: Dict[str, tuple] = {}
+        self._row_order: List[str] = []
+        self._cam_by_zone: Dict[str, List[CameraRecord]] = {}  # from the last refresh
+        self._last_sig: Optional[tuple] = None
+        self._sig_runs = 0  # consecutive fills with _last_sig
         self._COL_ACTIONS_INDEX = 8
 
         # Strong ref to wizard so it NEVER gets GC'ed unexpectedly
         self._wizard: Optional[ZoneWizard] = None
 
-        self._init_styles()
+        _register_styles_once()
         self._build(self.content)
 
-        self._refresh_all_async()
+        if self._resolve_company_id():
+            self._refresh_all_async()
         self._schedule_next_refresh()
         try:
-            self.bind("<Visibility>", lambda _e: self._refresh_all_async())
+            self.bind("<Visibility>", lambda _e: self._on_visible())
+            self.bind("<Destroy>", self._on_destroy)
         except Exception:
             pass
 
-    def _init_styles(self):
-        s = ttk.Style(self)
-        s.configure("Primary.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
-                    background=PRIMARY, foreground="white", borderwidth=0, relief="flat")
-        s.map("Primary.TButton", background=[("active", PRIMARY_HOVER)], relief=[("pressed", "sunken")])
-
-        s.configure("Success.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
-                    background=SUCCESS, foreground="white", borderwidth=0, relief="flat")
-        s.map("Success.TButton", background=[("active", SUCCESS_HOVER)], relief=[("pressed", "sunken")])
-
-        s.configure("Danger.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
-                    background=DANGER, foreground="white", borderwidth=0, relief="flat")
-        s.map("Danger.TButton", background=[("active", DANGER_HOVER)], relief=[(["pressed"], "sunken")])
-
-        s.configure("Admin.Treeview",
-                    background=CARD_BG, fieldbackground=CARD_BG, foreground=TEXT_FG,
-                    rowheight=28, borderwidth=0)
-        s.configure("Admin.Treeview.Heading",
-                    font=("Segoe UI Semibold", 10), foreground=TEXT_FG, background=CARD_BG, padding=(10, 8))
-
-        s.configure("FormKey.TLabel", background=CARD_BG, foreground="#333333", font=("Segoe UI", 10, "bold"))
-
-        s.configure("Warm.TCombobox",
-                    fieldbackground=ENTRY_BG, background=ENTRY_BG, foreground=TEXT_FG, arrowcolor=TEXT_FG)
-        s.map("Warm.TCombobox",
-              fieldbackground=[("readonly", ENTRY_BG), ("!disabled", ENTRY_BG), ("active", ENTRY_BG)],
-              foreground=[("readonly", TEXT_FG)],
-              background=[("readonly", ENTRY_BG), ("!disabled", ENTRY_BG), ("active", ENTRY_BG)],
-              arrowcolor=[("readonly", TEXT_FG), ("!disabled", TEXT_FG), ("active", TEXT_FG)])
-
     def _build(self, root: tk.Frame):
         page = tk.Frame(root, bg=PAGE_BG)
         page.pack(fill="both", expand=True, padx=16, pady=16)
@@ -401,9 +505,9 @@ class ZonesPage(PageShell):
                  bg=PAGE_BG, fg="#222222").pack(side="left")
 
         btns = tk.Frame(head, bg=PAGE_BG); btns.pack(side="right")
-        ttk.Button(btns, text="Refresh", style="Success.TButton",
-                   command=self._refresh_all_async).pack(side="left")
-        ttk.Button(btns, text="New Zone", style="Primary.TButton",
+        ttk.Button(btns, text="Refresh", style="Zones.Success.TButton",
+                   command=self._on_refresh_click).pack(side="left")
+        ttk.Button(btns, text="New Zone", style="Zones.Primary.TButton",
                    command=self._open_wizard).pack(side="left", padx=(8, 0))
 
         c_card, inner = card(page, fg=CARD_BG, border_color="#DCCEB5", border_width=2)
@@ -421,7 +525,7 @@ class ZonesPage(PageShell):
             columns=("id", "status", "name", "risk", "description", "camera", "mode", "actions"),
             show="headings",
             height=18,
-            style="Admin.Treeview",
+            style="Zones.Treeview",
             selectmode="none",
         )
 
@@ -465,56 +569,108 @@ class ZonesPage(PageShell):
         self.tree.tag_configure("row", background=CARD_BG, foreground=TEXT_FG)
 
         leg = tk.Frame(inner, bg=CARD_BG); leg.pack(fill="x", pady=(8, 2))
-        self._chip(leg, "● Online", fg=TAG_ONLINE_FG, bg=TAG_ONLINE_BG).pack(side="left", padx=(0, 8))
-        self._chip(leg, "● Offline", fg=TAG_OFFLINE_FG, bg=TAG_OFFLINE_BG).pack(side="left")
+        self._chip(leg, _STATUS_STR[True], "online").pack(side="left", padx=(0, 8))
+        self._chip(leg, _STATUS_STR[False], "offline").pack(side="left")
 
-    def _chip(self, parent, text, fg="#1f2937", bg="#eef2ff"):
-        return tk.Label(parent, text=text, bg=bg, fg=fg, padx=10, pady=4, font=("Segoe UI Semibold", 9))
+    def _chip(self, parent, text, kind: str):
+        return tk.Label(parent, text=text, **_CHIP_STYLES[kind])
 
-    def _refresh_all_async(self):
+    def _on_refresh_click(self):
+        # explicit Refresh drops parse caches so nothing stale survives it
+        _iso_to_epoch.cache_clear()
+        self._fresh_key.clear()
+        self._last_sig = None
+        self._refresh_all_async()
+
+    def _resolve_company_id(self) -> bool:
+        """Read the company from the session once; refreshes reuse it."""
         try:
             user = require_user()
         except Exception as e:
             messagebox.showerror("Zones", f"No session: {e}")
+            return False
+        self.company_id = str(user.get("company_id") or "").strip()
+        return True
+
+    def _run_trailing_refresh(self):
+        self._refresh_trailing = None
+        self._refresh_all_async()
+
+    def _refresh_all_async(self):
+        now = time.monotonic()
+        if self._refresh_inflight or (now - self._last_refresh_ts) * 1000 < REFRESH_DEBOUNCE_MS:
+            # one trailing call covers the whole burst
+            if self._refresh_trailing is None:
+                self._refresh_trailing = self.after(REFRESH_DEBOUNCE_MS, self._run_trailing_refresh)
             return
+        self._last_refresh_ts = now
 
-        self.company_id = str(user.get("company_id") or "").strip()
-        if not self.company_id:
+        if self.company_id is None and not self._resolve_company_id():
+            return
+        company_id = self.company_id
+        if not company_id:
             self._zones = []
             self._fill_table({})  # pass empty camera map
             return
 
         def _work():
             try:
-                zones = list_zones(self.company_id) or []
-                cams = list_cameras_by_company(self.company_id) or []
-                cam_by_zone: Dict[str, List[Dict[str, Any]]] = {}
-                for c in cams:
-                    zid = str(c.get("zone_id") or "")
-                    if not zid:
-                        continue
-                    cam_by_zone.setdefault(zid, []).append(c)
+                zones = list_zones(company_id) or []
+                cam_by_zone = list_cameras_by_company_grouped(company_id)
                 return (zones, cam_by_zone)
             except Exception as e:
                 return e
 
         def _done(result):
+            self._refresh_inflight = False
             if isinstance(result, Exception):
+                if type(result).__name__ in _AUTH_ERRORS and not self._auth_retried:
+                    # session may have changed under us: re-read it and retry once
+                    self._auth_retried = True
+                    self.company_id = None
+                    self._last_refresh_ts = 0.0
+                    self._refresh_all_async()
+                    return
                 messagebox.showerror("Zones", f"Failed to load: {result}")
                 return
+            self._auth_retried = False
             zones, cam_by_zone = result
+            sig = _snapshot_sig(zones, cam_by_zone, time.time(), self._fresh_key)
+            if sig == self._last_sig:
+                # after REQUIRED_STREAK identical fills the debounce has settled,
+                # so another fill could not change a single cell
+                if self._sig_runs >= REQUIRED_STREAK:
+                    return
+                self._sig_runs += 1
+            else:
+                self._last_sig = sig
+                self._sig_runs = 1
             self._zones = zones
             self._fill_table(cam_by_zone)
 
+        self._refresh_inflight = True
         run_async(_work, _done, self)
 
-    def _debounced_online(self, cam: Dict[str, Any]) -> bool:
-        cam_id = str(cam.get("id") or cam.get("name") or "")
+    def _reset_online_state(self) -> None:
+        # online debounce state, one slot per camera id (grown on demand)
+        self._cam_index: Dict[str, int] = {}
+        # numpy arrays when available (for _batch_online), plain lists otherwise
+        if np is not None:
+            self._streak_arr = np.zeros(256, dtype=np.int8)
+            self._decision_arr = np.zeros(256, dtype=bool)
+        else:
+            self._streak_arr = [0] * 256
+            self._decision_arr = [False] * 256
+        self._fresh_key: Dict[str, str] = {}  # cam_id -> heartbeat field it populates
+
+    def _debounced_online(self, cam: CameraRecord, now_ts: float) -> bool:
+        cam_id = str(cam.id or cam.name or "")
         if not cam_id:
-            return _camera_fresh(cam)
-        fresh = _camera_fresh(cam)
-        prev_decision = self._decision.get(cam_id, False)
-        streak = self._streaks.get(cam_id, 0)
+            return _camera_fresh(cam, now_ts)
+        fresh = _camera_fresh(cam, now_ts, self._fresh_key, cam_id)
+        i = self._cam_slot(cam_id)
+        prev_decision = bool(self._decision_arr[i])
+        streak = int(self._streak_arr[i])
         if fresh:
             streak = streak + 1 if streak >= 0 else 1
         else:
@@ -526,42 +682,107 @@ class ZonesPage(PageShell):
         elif streak <= -REQUIRED_STREAK:
             decision = False
             streak = max(streak, -REQUIRED_STREAK)
-        self._streaks[cam_id] = streak
-        self._decision[cam_id] = decision
+        self._streak_arr[i] = streak
+        self._decision_arr[i] = decision
         return decision
 
-    def _status_chip_text(self, online: bool) -> str:
-        return "● Online" if online else "● Offline"
+    def _batch_online(self, cams: List[CameraRecord], now_ts: float) -> Dict[str, bool]:
+        """Vectorized _debounced_online over many cameras; returns cam_id -> decision."""
+        ids = [str(c.id or c.name or "") for c in cams]
+        ts = np.array([
+            np.nan if (t := _heartbeat_epoch(c, self._fresh_key, cid)) is None else t
+            for c, cid in zip(cams, ids)
+        ], dtype=np.float64)
+        reported = np.fromiter((bool(c.online) for c in cams), dtype=bool, count=len(cams))
+        no_hb = np.isnan(ts)
+        # NaN compares False, so cameras without a heartbeat fall back to `online`
+        fresh = np.where(no_hb, reported, (now_ts - ts) <= ONLINE_MAX_AGE_SEC)
+
+        slots = np.fromiter((self._cam_slot(cid) for cid in ids), dtype=np.intp, count=len(ids))
+        streak = self._streak_arr[slots].astype(np.int16)
+        streak = np.where(fresh, np.where(streak >= 0, streak + 1, 1),
+                          np.where(streak <= 0, streak - 1, -1))
+        decision = np.where(streak >= REQUIRED_STREAK, True,
+                            np.where(streak <= -REQUIRED_STREAK, False, self._decision_arr[slots]))
+        self._streak_arr[slots] = np.clip(streak, -REQUIRED_STREAK, REQUIRED_STREAK)
+        self._decision_arr[slots] = decision
+        return dict(zip(ids, decision.tolist()))
+
+    def _cam_slot(self, cam_id: str) -> int:
+        i = self._cam_index.get(cam_id)
+        if i is None:
+            i = self._cam_index[cam_id] = len(self._cam_index)
+            n = len(self._streak_arr)
+            if i >= n:
+                if np is None:
+                    self._streak_arr.extend([0] * n)
+                    self._decision_arr.extend([False] * n)
+                else:
+                    # zero-filled growth (np.resize would repeat old values)
+                    self._streak_arr = np.concatenate([self._streak_arr, np.zeros(n, dtype=np.int8)])
+                    self._decision_arr = np.concatenate([self._decision_arr, np.zeros(n, dtype=bool)])
+        return i
 
     # ← now accepts a precomputed camera map (no per-zone queries)
-    def _fill_table(self, cam_by_zone: Dict[str, List[Dict[str, Any]]] | None = None):
+    def _fill_table(self, cam_by_zone: Dict[str, List[CameraRecord]] | None = None):
         cam_by_zone = cam_by_zone or {}
+        self._cam_by_zone = cam_by_zone
+        now_ts = time.time()  # UTC epoch, shared by every camera in this pass
+
+        # large fleets: debounce every zone's first camera in one numpy pass
+        batched: Optional[Dict[str, bool]] = None
+        firsts = [cams[0] for z in self._zones if (cams := cam_by_zone.get(z["id"]))]
+        if np is not None and len(firsts) > VECTOR_MIN_CAMS and all(c.id or c.name for c in firsts):
+            batched = self._batch_online(firsts, now_ts)
 
-        for r in self.tree.get_children():
-            self.tree.delete(r)
+        tree = self.tree
+        tcall = tree.tk.call  # straight to Tcl; skips ttk's per-call option formatting
+        row_index = self._row_index
+        seen = set()
+        added: List[str] = []
 
         for i, z in enumerate(self._zones):
             cams = cam_by_zone.get(z["id"], [])
-            status_txt, cam_txt, tag, mode_disp = "● Offline", "—", "row-offline", "—"
+            online, cam_txt, mode_disp = False, "—", "—"
             if cams:
                 first = cams[0]
-                online = self._debounced_online(first)
-                status_txt = self._status_chip_text(online)
-                tag = "row-online" if online else "row-offline"
-                name = first.get("name") or first.get("id", "")
-                mode_disp = _mode_to_display(first.get("mode") or "monitor")
+                if batched is not None:
+                    online = batched[str(first.id or first.name)]
+                else:
+                    online = self._debounced_online(first, now_ts)
+                name = first.name or first.id
+                mode_disp = _mode_to_display(first.mode or "monitor")
                 extra = len(cams) - 1
                 cam_txt = f"{name} (+{extra})" if extra > 0 else name
 
             vals = (
-                z["id"], status_txt, z.get("name", ""),
+                z["id"], _STATUS_STR[online], z.get("name", ""),
                 _risk_to_display(z.get("risk_level") or "med"),
                 z.get("description", ""), cam_txt, mode_disp,
                 "✏ Edit   🗑 Delete",
             )
-            row = self.tree.insert("", "end", values=vals, tags=("row", tag))
-            if i % 2:
-                self.tree.item(row, tags=self.tree.item(row, "tags") + ("row-alt",))
+            tag = _STATUS_TAG[online]
+            tags = ("row", tag, "row-alt") if i % 2 else ("row", tag)
+            zid = z["id"]
+            seen.add(zid)
+            prev = row_index.get(zid)
+            if prev is None:
+                iid = tcall(tree, "insert", "", "end", "-values", vals, "-tags", tags)
+                row_index[zid] = (iid, (vals, tags))
+                added.append(zid)
+            elif prev[1] != (vals, tags):
+                tcall(tree, "item", prev[0], "-values", vals, "-tags", tags)
+                row_index[zid] = (prev[0], (vals, tags))
+
+        for zid in [k for k in row_index if k not in seen]:
+            tree.delete(row_index.pop(zid)[0])
+
+        # new rows went to the end; only reorder if that isn't the wanted order
+        order = [z["id"] for z in self._zones]
+        if order != [k for k in self._row_order if k in seen] + added:
+            for idx, zid in enumerate(order):
+                tree.move(row_index[zid][0], "", idx)
+        self._row_order = order
 
     def _on_tree_click(self, event):
         region = self.tree.identify("region", event.x, event.y)
@@ -586,26 +807,12 @@ class ZonesPage(PageShell):
         if not vals:
             return
         zone_id, _status, cur_name, cur_risk, cur_desc, _camera, cur_mode, _ = vals
+        cached = self._cam_by_zone.get(zone_id)
+        cam_id = cached[0].id if cached else None
 
         dlg = tk.Toplevel(self); dlg.title("Edit Zone")
         dlg.transient(self.winfo_toplevel()); dlg.grab_set(); dlg.configure(bg=CARD_BG); dlg.resizable(False, False)
 
-        s = ttk.Style(dlg)
-        s.configure("FormKey.TLabel", background=CARD_BG, foreground="#333333", font=("Segoe UI", 10, "bold"))
-        s.configure("Primary.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
-                    background=PRIMARY, foreground="white", borderwidth=0, relief="flat")
-        s.map("Primary.TButton", background=[("active", PRIMARY_HOVER)])
-        s.configure("Danger.TButton", font=("Segoe UI Semibold", 10), padding=(14, 6),
-                    background=DANGER, foreground="white", borderwidth=0, relief="flat")
-        s.map("Danger.TButton", background=[("active", DANGER_HOVER)])
-        s.configure("Warm.TCombobox",
-                    fieldbackground=ENTRY_BG, background=ENTRY_BG, foreground=TEXT_FG, arrowcolor=TEXT_FG)
-        s.map("Warm.TCombobox",
-              fieldbackground=[("readonly", ENTRY_BG), ("!disabled", ENTRY_BG), ("active", ENTRY_BG)],
-              foreground=[("readonly", TEXT_FG)],
-              background=[("readonly", ENTRY_BG), ("!disabled", ENTRY_BG), ("active", ENTRY_BG)],
-              arrowcolor=[("readonly", TEXT_FG), ("!disabled", TEXT_FG), ("active", TEXT_FG)])
-
         for prefix in ("*TCombobox*Listbox", "*Combobox*Listbox", "*Listbox"):
             dlg.option_add(f"{prefix}.background", ENTRY_BG)
             dlg.option_add(f"{prefix}.foreground", TEXT_FG)
@@ -616,24 +823,24 @@ class ZonesPage(PageShell):
         frm = tk.Frame(dlg, bg=CARD_BG); frm.pack(padx=16, pady=16)
         frm.grid_columnconfigure(1, weight=1)
 
-        ttk.Label(frm, text="Zone Name", style="FormKey.TLabel").grid(row=0, column=0, sticky="e", padx=(0, 10), pady=6)
+        ttk.Label(frm, text="Zone Name", style="Zones.FormKey.TLabel").grid(row=0, column=0, sticky="e", padx=(0, 10), pady=6)
         name_e = tk.Entry(frm, bg=ENTRY_BG, fg=TEXT_FG, relief="flat")
         name_e.insert(0, cur_name); name_e.grid(row=0, column=1, sticky="ew", pady=6)
 
-        ttk.Label(frm, text="Risk", style="FormKey.TLabel").grid(row=1, column=0, sticky="e", padx=(0, 10), pady=6)
-        risk_cb = ttk.Combobox(frm, values=RISK_VALUES, state="readonly", style="Warm.TCombobox")
+        ttk.Label(frm, text="Risk", style="Zones.FormKey.TLabel").grid(row=1, column=0, sticky="e", padx=(0, 10), pady=6)
+        risk_cb = ttk.Combobox(frm, values=RISK_VALUES, state="readonly", style="Zones.Warm.TCombobox")
         risk_cb.set(_risk_to_display(cur_risk)); risk_cb.grid(row=1, column=1, sticky="w", pady=6)
 
-        ttk.Label(frm, text="Description", style="FormKey.TLabel").grid(row=2, column=0, sticky="e", padx=(0, 10), pady=6)
+        ttk.Label(frm, text="Description", style="Zones.FormKey.TLabel").grid(row=2, column=0, sticky="e", padx=(0, 10), pady=6)
         desc_e = tk.Entry(frm, bg=ENTRY_BG, fg=TEXT_FG, relief="flat")
         desc_e.insert(0, cur_desc or ""); desc_e.grid(row=2, column=1, sticky="ew", pady=6)
 
-        ttk.Label(frm, text="Camera Mode", style="FormKey.TLabel").grid(row=3, column=0, sticky="e", padx=(0, 10), pady=6)
-        mode_cb = ttk.Combobox(frm, values=MODE_VALUES, state="readonly", style="Warm.TCombobox")
+        ttk.Label(frm, text="Camera Mode", style="Zones.FormKey.TLabel").grid(row=3, column=0, sticky="e", padx=(0, 10), pady=6)
+        mode_cb = ttk.Combobox(frm, values=MODE_VALUES, state="readonly", style="Zones.Warm.TCombobox")
         mode_cb.set(_mode_to_display(cur_mode)); mode_cb.grid(row=3, column=1, sticky="w", pady=6)
 
         btns = tk.Frame(frm, bg=CARD_BG); btns.grid(row=4, column=0, columnspan=2, sticky="e", pady=(12, 0))
-        ttk.Button(btns, text="Cancel", style="Danger.TButton", command=dlg.destroy).pack(side="right", padx=(0, 8))
+        ttk.Button(btns, text="Cancel", style="Zones.Danger.TButton", command=dlg.destroy).pack(side="right", padx=(0, 8))
 
         def save():
             def _work():
@@ -641,9 +848,12 @@ class ZonesPage(PageShell):
                             name=(name_e.get() or "").strip(),
                             description=(desc_e.get() or "").strip(),
                             risk_level=_risk_to_store(risk_cb.get()))
-                cams = list_cameras_by_zone(zone_id)  # one-off query is fine here
-                if cams:
-                    update_camera(cams[0]["id"], mode=_mode_to_store(mode_cb.get()))
+                if cam_id:
+                    update_camera(cam_id, mode=_mode_to_store(mode_cb.get()))
+                else:
+                    cams = list_cameras_by_zone(zone_id)  # not in the last refresh
+                    if cams:
+                        update_camera(cams[0]["id"], mode=_mode_to_store(mode_cb.get()))
                 return True
 
             def _done(result):
@@ -652,7 +862,7 @@ class ZonesPage(PageShell):
                 dlg.destroy(); self._refresh_all_async()
             run_async(_work, _done, dlg)
 
-        ttk.Button(btns, text="Save", style="Primary.TButton", command=save).pack(side="right")
+        ttk.Button(btns, text="Save", style="Zones.Primary.TButton", command=save).pack(side="right")
 
     def _delete_zone_cascade(self, item_id: str):
         vals = self.tree.item(item_id, "values")
@@ -674,8 +884,7 @@ class ZonesPage(PageShell):
             return
 
         def _work():
-            for c in cameras:
-                delete_camera(c["id"])
+            delete_cameras_by_zone(zone_id)
             delete_zone(zone_id, force=True)
             return True
 
@@ -701,22 +910,46 @@ class ZonesPage(PageShell):
         # Clear the reference when it really closes
         self._wizard.bind("<Destroy>", lambda _e: setattr(self, "_wizard", None))
 
+    def _on_visible(self):
+        self._refresh_all_async()
+        if not self._refresh_job:
+            self._schedule_next_refresh()  # re-arm polling paused while offscreen
+
     def _schedule_next_refresh(self):
-        if self._refresh_job:
-            try:
-                self.after_cancel(self._refresh_job)
-            except Exception:
-                pass
+        self._cancel_jobs(trailing=False)
+        try:
+            viewable = self.winfo_viewable()
+        except Exception:
+            viewable = False
+        if not viewable:
+            return  # nobody sees the table; <Visibility> re-arms
         self._refresh_job = self.after(AUTO_REFRESH_MS, self._refresh_and_reschedule)
 
     def _refresh_and_reschedule(self):
+        self._refresh_job = None
+        try:
+            if not self.winfo_viewable():
+                return
+        except Exception:
+            return
         self._refresh_all_async()
         self._schedule_next_refresh()
 
+    def _cancel_jobs(self, trailing: bool = True):
+        jobs = ("_refresh_job", "_refresh_trailing") if trailing else ("_refresh_job",)
+        for attr in jobs:
+            job = getattr(self, attr, None)
+            if job:
+                try:
+                    self.after_cancel(job)
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._cancel_jobs()
+
     def destroy(self):
-        try:
-            if self._refresh_job:
-                self.after_cancel(self._refresh_job)
-        except Exception:
-            pass
+        self._cancel_jobs()
         super().destroy()
@@ -1,45 +1,62 @@
 from __future__ import annotations
 
-import random
-import string
+import functools
+import hmac
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 from services.session import require_user
 from services.firebase_client import get_db
 from services.firestore_compat import eq
+from services.firebase_auth import invalidate_user
 
 # ─────────────────────────────────────────────────────────────
 # Optional integrations (mailer + security)
 # Mailer: use if available; otherwise fall back to dev logging.
 try:
     from services.mailer import send_password_otp as _send_password_otp  # (email, code) -> None
+    from services.email_queue import prewarm as _prewarm_mailer
 except Exception:  # pragma: no cover - optional dep
     _send_password_otp = None  # type: ignore
+    _prewarm_mailer = None  # type: ignore
 
 # Security: prefer your project's helpers; else use a PBKDF2 fallback.
 try:
     from services.security import hash_password as _hash_pw, verify_password as _verify_pw
 except Exception:  # pragma: no cover - optional dep
-    import hashlib, os, hmac, base64
+    import hashlib, os, base64
 
-    _PBKDF2_ITER = 100_000
+    _PBKDF2_ITER = 100_000          # legacy 'pbkdf2$' (SHA-256) hashes
+    _PBKDF2_SHA512_ITER = 210_000   # current 'pbkdf2-sha512$' hashes
+
+    # stored prefix -> (digest, iterations)
+    _PBKDF2_SCHEMES = {
+        "pbkdf2-sha512$": ("sha512", _PBKDF2_SHA512_ITER),
+        "pbkdf2$": ("sha256", _PBKDF2_ITER),
+    }
 
     def _hash_pw(pw: str) -> str:
-        """PBKDF2-HMAC-SHA256 fallback. Stored format: 'pbkdf2$<base64(salt+dk)>'."""
+        """PBKDF2-HMAC-SHA512 fallback. Stored format: 'pbkdf2-sha512$<base64(salt+dk)>'."""
         if not isinstance(pw, str) or not pw:
             raise ValueError("Password must be a non-empty string.")
         salt = os.urandom(16)
-        dk = hashlib.pbkdf2_hmac("sha256", pw.encode("utf-8"), salt, _PBKDF2_ITER)
-        return "pbkdf2$" + base64.b64encode(salt + dk).decode("ascii")
+        dk = hashlib.pbkdf2_hmac("sha512", pw.encode("utf-8"), salt, _PBKDF2_SHA512_ITER)
+        return "pbkdf2-sha512$" + base64.b64encode(salt + dk).decode("ascii")
 
     def _verify_pw(pw: str, stored: str) -> bool:
         try:
-            if not (isinstance(stored, str) and stored.startswith("pbkdf2$")):
+            if not isinstance(stored, str):
+                return False
+            prefix, sep, b64 = stored.partition("$")
+            scheme = _PBKDF2_SCHEMES.get(prefix + sep)
+            if scheme is None:
                 return False
-            raw = base64.b64decode(stored.split("$", 1)[1].encode("ascii"))
+            digest, iters = scheme
+            raw = base64.b64decode(b64.encode("ascii"))
             salt, dk = raw[:16], raw[16:]
-            check = hashlib.pbkdf2_hmac("sha256", pw.encode("utf-8"), salt, _PBKDF2_ITER)
+            check = hashlib.pbkdf2_hmac(digest, pw.encode("utf-8"), salt, iters)
             return hmac.compare_digest(dk, check)
         except Exception:
             return False
@@ -51,6 +68,11 @@ except Exception:  # pragma: no cover - optional dep
 _OTP_TTL_MINUTES = 10
 _MIN_NAME_LEN = 2
 _MIN_PASSWORD_LEN = 8
+_PROFILE_TTL_S = 30.0
+_PW_FIELDS = ("password_hash",)  # all change_password/delete_account read
+
+# (uid or email_lower) -> (monotonic ts, doc id, doc data); pages poll get_profile
+_PROFILE_CACHE: Dict[str, tuple] = {}
 
 
 def _now_utc() -> datetime:
@@ -58,48 +80,97 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@functools.lru_cache(maxsize=512)
 def _norm_email(email: str) -> str:
     """Normalize email for lookups."""
     return (email or "").strip().lower()
 
 
+@functools.lru_cache(maxsize=1)
 def _users_query():
-    """Firestore collection ref for users."""
+    """Firestore collection ref for users (built once; get_db() is a singleton)."""
     return get_db().collection("users")
 
 
-def _find_user_by_email(email: str) -> Optional[Any]:
+def _email_index():
+    """email_index/{email_lower} -> {"user_id": ...}, for users whose email changed."""
+    return get_db().collection("email_index")
+
+
+_EMAIL_FIELDS = ("email", "email_lower")
+
+
+def _get_doc(ref: Any, fields: Optional[tuple] = None) -> Any:
+    """ref.get(), restricted to `fields` (plus the email fields) when the client supports field masks."""
+    if fields:
+        try:
+            return ref.get(field_paths=list(fields + _EMAIL_FIELDS))
+        except TypeError:
+            pass
+    return ref.get()
+
+
+def _snap_has_email(snap: Any, email_l: str) -> bool:
+    d = snap.to_dict() or {}
+    return _norm_email(d.get("email_lower") or d.get("email") or "") == email_l
+
+
+def _find_user_by_email(email: str, fields: Optional[tuple] = None) -> Optional[Any]:
     """
     Return a Firestore document snapshot for this email (case-insensitive)
-    or None if not found.
+    or None if not found. `fields` limits what is fetched (see _get_doc).
     """
     email_l = _norm_email(email)
+    if not email_l:
+        return None
 
-    # Prefer a stored normalized field if available
+    # Users are created with the lowercased email as document id: one read
     try:
-        snaps = list(eq(_users_query(), "email_lower", email_l).stream())
-        if snaps:
-            return snaps[0]
+        snap = _get_doc(_users_query().document(email_l), fields)
+        if snap and snap.exists and _snap_has_email(snap, email_l):
+            return snap
     except Exception:
         pass
 
-    # Fallback to exact match on 'email'
+    # Email changed after creation -> index doc points at the real id
     try:
-        snaps = list(eq(_users_query(), "email", email).stream())
-        if snaps:
-            return snaps[0]
+        idx = _email_index().document(email_l).get()
+        if idx and idx.exists:
+            snap = _find_user_by_id((idx.to_dict() or {}).get("user_id"), fields)
+            if snap and _snap_has_email(snap, email_l):
+                return snap
     except Exception:
         pass
 
+    # Legacy rows: query by field, then backfill the index for next time
+    for field, value in (("email_lower", email_l), ("email", email)):
+        try:
+            snaps = list(eq(_users_query(), field, value).stream())
+        except Exception:
+            continue
+        if snaps:
+            _index_email(email_l, snaps[0].id)
+            return snaps[0]
+
     return None
 
 
-def _find_user_by_id(doc_id: Optional[str]) -> Optional[Any]:
+def _index_email(email_l: str, user_id: str) -> None:
+    """Best-effort email_index write; not needed when the doc id is the email."""
+    if not email_l or user_id == email_l:
+        return
+    try:
+        _email_index().document(email_l).set({"user_id": user_id})
+    except Exception:
+        pass
+
+
+def _find_user_by_id(doc_id: Optional[str], fields: Optional[tuple] = None) -> Optional[Any]:
     """Load user by Firestore document id."""
     if not doc_id:
         return None
     try:
-        snap = _users_query().document(str(doc_id)).get()
+        snap = _get_doc(_users_query().document(str(doc_id)), fields)
         if snap and snap.exists:
             return snap
     except Exception:
@@ -126,6 +197,12 @@ def _update_session_cache(fields: Dict[str, Any]) -> None:
         pass
 
 
+def _drop_profile_cache(doc_id: Optional[str] = None) -> None:
+    """Any write to a user doc invalidates cached profiles (one user per process)."""
+    _PROFILE_CACHE.clear()
+    invalidate_user(doc_id)  # login cache is keyed by users/{email} doc id
+
+
 def _require_non_empty(value: str, label: str) -> str:
     v = (value or "").strip()
     if not v:
@@ -148,11 +225,18 @@ def get_profile() -> Dict[str, Any]:
     email = _norm_email(user.get("email", ""))
     uid = user.get("id") or user.get("uid") or user.get("doc_id")
 
-    snap = _find_user_by_email(email)
-    if not snap:
-        snap = _find_user_by_id(uid)
-
-    data = snap.to_dict() if snap else {}
+    key = str(uid or email)
+    hit = _PROFILE_CACHE.get(key)
+    if hit and time.monotonic() - hit[0] < _PROFILE_TTL_S:
+        _ts, doc_id, data = hit
+    else:
+        snap = _find_user_by_email(email)
+        if not snap:
+            snap = _find_user_by_id(uid)
+        doc_id = snap.id if snap else None
+        data = (snap.to_dict() or {}) if snap else {}
+        if snap:
+            _PROFILE_CACHE[key] = (time.monotonic(), doc_id, data)
 
     return {
         "email": data.get("email", user.get("email")),
@@ -161,7 +245,7 @@ def get_profile() -> Dict[str, Any]:
         "company_id": data.get("company_id", user.get("company_id")),
         "company_name": data.get("company_name", user.get("company_name")),
         "status": data.get("status", "active"),
-        "id": (snap.id if snap else user.get("id")),
+        "id": (doc_id or user.get("id")),
     }
 
 
@@ -193,6 +277,13 @@ def update_profile(*, name: str, email: str) -> None:
         "updated_at": _now_utc(),
     }
     snap.reference.update(updates)
+    _drop_profile_cache(snap.id)
+    if email_l != old_email:
+        _index_email(email_l, snap.id)
+        try:
+            _email_index().document(old_email).delete()
+        except Exception:
+            pass
 
     # Session cache refresh
     _update_session_cache({"name": name, "email": email})
@@ -207,7 +298,7 @@ def change_password(old_password: str, new_password: str) -> None:
     email = _norm_email(user.get("email", ""))
     uid = user.get("id") or user.get("uid") or user.get("doc_id")
 
-    snap = _find_user_by_email(email) or _find_user_by_id(uid)
+    snap = _find_user_by_email(email, _PW_FIELDS) or _find_user_by_id(uid, _PW_FIELDS)
     if not snap:
         raise RuntimeError("Profile not found.")
 
@@ -229,6 +320,7 @@ def change_password(old_password: str, new_password: str) -> None:
         # clear any pending reset
         "pw_reset": None,
     })
+    _drop_profile_cache(snap.id)
 
 
 def start_password_reset(email: str) -> None:
@@ -240,18 +332,21 @@ def start_password_reset(email: str) -> None:
     'Email doesn't exist.' (no fake success).
     """
     email = _require_non_empty(email, "Email")
+    if _prewarm_mailer:
+        _prewarm_mailer()  # SMTP handshake overlaps with the lookup + write below
     snap = _find_user_by_email(email)
     if not snap:
         raise ValueError("Email doesn't exist.")
 
-    code = "".join(random.choices(string.digits, k=6))
-    expires_at = _now_utc() + timedelta(minutes=_OTP_TTL_MINUTES)
+    code = f"{secrets.randbelow(1_000_000):06d}"
+    now = _now_utc()
+    expires_at = now + timedelta(minutes=_OTP_TTL_MINUTES)
 
     snap.reference.update({
         "pw_reset": {
             "code": code,
             "expires_at": expires_at,
-            "sent_at": _now_utc(),
+            "sent_at": now,
         }
     })
 
@@ -274,8 +369,9 @@ def verify_password_reset(email: str, otp_code: str, new_password: str) -> None:
     otp_code = _require_non_empty(otp_code, "OTP code")
     if not isinstance(new_password, str) or len(new_password) < _MIN_PASSWORD_LEN:
         raise ValueError(f"New password must be at least {_MIN_PASSWORD_LEN} characters long.")
+    now = _now_utc()
 
-    snap = _find_user_by_email(email)
+    snap = _find_user_by_email(email, ("pw_reset",))
     if not snap:
         # Don't reveal which part failed (generic error)
         raise ValueError("Invalid or expired OTP.")
@@ -288,7 +384,8 @@ def verify_password_reset(email: str, otp_code: str, new_password: str) -> None:
 
     if not code or not exp:
         raise ValueError("No reset request found.")
-    if otp_code.strip() != code:
+    # constant-time: don't leak how many leading digits matched
+    if not hmac.compare_digest(otp_code.strip().encode("utf-8"), code.encode("utf-8")):
         raise ValueError("Incorrect OTP.")
 
     # Normalize timestamp (Firestore Timestamp or datetime)
@@ -301,15 +398,16 @@ def verify_password_reset(email: str, otp_code: str, new_password: str) -> None:
         # If normalization fails, treat as expired rather than silently accept
         raise ValueError("OTP expired. Please request a new one.")
 
-    if _now_utc() > exp:
+    if now > exp:
         raise ValueError("OTP expired. Please request a new one.")
 
     new_hash = _hash_pw(new_password)
     snap.reference.update({
         "password_hash": new_hash,
-        "pw_changed_at": _now_utc(),
+        "pw_changed_at": now,
         "pw_reset": None,
     })
+    _drop_profile_cache(snap.id)
 
 
 def delete_account(password: str) -> None:
@@ -321,7 +419,7 @@ def delete_account(password: str) -> None:
     email = _norm_email(user.get("email", ""))
     uid = user.get("id") or user.get("uid") or user.get("doc_id")
 
-    snap = _find_user_by_email(email) or _find_user_by_id(uid)
+    snap = _find_user_by_email(email, _PW_FIELDS) or _find_user_by_id(uid, _PW_FIELDS)
     if not snap:
         raise RuntimeError("Profile not found.")
 
@@ -333,3 +431,4 @@ def delete_account(password: str) -> None:
     # NOTE: If there are foreign references (zones, cameras, logs), handle cleanup here
     # before deleting the user doc to avoid dangling references.
     snap.reference.delete()
+    _drop_profile_cache(snap.id)
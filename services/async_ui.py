@@ -1,13 +1,17 @@
 # services/async_ui.py
 from __future__ import annotations
 
+import os
 import tkinter as tk
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Literal, Optional
 
-# I keep a small global pool for background work (Firestore, HTTP, file I/O, etc.).
-# 4 workers are plenty for my UI so I don't overwhelm the system.
-_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bg")
+# Two global pools so slow hashing never queues Firestore/HTTP reads behind it:
+#   • io  — Firestore, HTTP, file I/O (mostly waiting, so a few more threads)
+#   • cpu — password hashing and similar CPU-bound work (one per core)
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="io")
+_CPU_EXECUTOR = ThreadPoolExecutor(max_workers=max(2, os.cpu_count() or 2), thread_name_prefix="cpu")
+_EXECUTOR = _IO_EXECUTOR  # older name, still imported elsewhere
 
 
 def _widget_alive(w: Optional[tk.Misc]) -> bool:
@@ -22,6 +26,8 @@ def run_async(
     func: Callable[[], Any],
     ui_call: Callable[[Any], None],
     tk_widget: tk.Misc,
+    *,
+    kind: Literal["io", "cpu"] = "io",
 ) -> Future:
     """
     Run `func` in a background thread and deliver its result back on the Tk main thread.
@@ -31,11 +37,13 @@ def run_async(
       • When the future completes, I schedule `ui_call(value)` on the main thread.
       • If `func` raised, I call `ui_call(Exception)` instead so the UI layer can decide.
       • I only post back if `tk_widget` is still alive to avoid touching dead widgets.
+      • `kind="cpu"` sends hashing-style work to the CPU pool instead of the I/O pool.
 
     Returns:
       concurrent.futures.Future — I can cancel it or inspect exceptions if needed.
     """
-    fut: Future = _EXECUTOR.submit(func)
+    pool = _CPU_EXECUTOR if kind == "cpu" else _IO_EXECUTOR
+    fut: Future = pool.submit(func)
 
     def _deliver(f: Future) -> None:
         # Collect either the result or the exception
@@ -59,12 +67,12 @@ def run_async(
                 # I don't let a UI exception kill the Tk loop.
                 pass
 
-        if _widget_alive(tk_widget):
-            try:
-                tk_widget.after(0, _call_ui)
-            except tk.TclError:
-                # Main loop may be shutting down; ignore.
-                pass
+        # _call_ui re-checks liveness on the Tk thread, so no pre-check here
+        try:
+            tk_widget.after(0, _call_ui)
+        except (tk.TclError, RuntimeError):
+            # Widget gone or main loop shutting down; ignore.
+            pass
 
     fut.add_done_callback(_deliver)
     return fut
@@ -75,6 +83,8 @@ def run(
     worker: Callable[[], Any],
     ui_call: Callable[[Any], None],
     tk_widget: tk.Misc,
+    *,
+    kind: Literal["io", "cpu"] = "io",
 ) -> Future:
     """Alias to keep older imports working."""
-    return run_async(worker, ui_call, tk_widget)
+    return run_async(worker, ui_call, tk_widget, kind=kind)
@@ -1,11 +1,25 @@
 # services/async_view.py
 from __future__ import annotations
 
-import threading
 import tkinter as tk
 from typing import Callable, Any, Optional
 
 from services.ui_theme import PALETTE, FONTS
+from services.async_ui import _EXECUTOR
+
+# Theme values resolved once (the palette is static); every page mount reuses them.
+_BG = PALETTE.get("bg", "#0E1116")
+_CARD = PALETTE.get("card", "#161A22")
+_BORDER = PALETTE.get("border", "#222c3a")
+_FG = PALETTE.get("fg", PALETTE.get("text", "#E5E7EB"))
+_MUTED = PALETTE.get("muted", "#6b7280")
+_DANGER = PALETTE.get("danger", "#b91c1c")
+_H2 = FONTS.get("h2", ("Segoe UI", 16))
+_SMALL = FONTS.get("small", ("Segoe UI", 9))
+
+# Skeleton shimmer bars: same look on every page, so one shared option set.
+_SKELETON_BARS = 5
+_BAR_OPTS = {"bg": "#eef2ff", "height": 14}
 
 
 class LazyPage(tk.Frame):
@@ -33,7 +47,7 @@ class LazyPage(tk.Frame):
         render: Callable[[Any, tk.Frame], tk.Widget],
         title: Optional[str] = None,
     ):
-        super().__init__(parent, bg=PALETTE.get("bg", "#0E1116"))
+        super().__init__(parent, bg=_BG)
         self._worker: Callable[[], Any] = worker
         self._render: Callable[[Any, tk.Frame], tk.Widget] = render
         self._title: str = title or "Loading…"
@@ -47,22 +61,17 @@ class LazyPage(tk.Frame):
         self._build_skeleton()
         self.bind("<Destroy>", self._on_destroy)
 
-        # I run the worker in a daemon thread to avoid blocking app exit.
-        t = threading.Thread(target=self._run_worker, daemon=True, name="LazyPageWorker")
-        t.start()
+        # Shared background pool: no thread spawned per page mount.
+        _EXECUTOR.submit(self._run_worker)
 
     # ───────────────────────── UI skeleton ─────────────────────────
     def _build_skeleton(self) -> None:
-        bg = PALETTE.get("bg", "#0E1116")
-        card = PALETTE.get("card", "#161A22")
-        border = PALETTE.get("border", "#222c3a")
-        fg = PALETTE.get("fg", PALETTE.get("text", "#E5E7EB"))
-        muted = PALETTE.get("muted", "#6b7280")
+        bg, card, border, fg, muted = _BG, _CARD, _BORDER, _FG, _MUTED
 
         # Header
         hdr = tk.Frame(self, bg=card, height=56, highlightthickness=1, highlightbackground=border)
         hdr.pack(fill="x")
-        tk.Label(hdr, text=self._title, bg=card, fg=fg, font=FONTS.get("h2", ("Segoe UI", 16)), padx=16)\
+        tk.Label(hdr, text=self._title, bg=card, fg=fg, font=_H2, padx=16)\
             .pack(side="left")
 
         # Body placeholder
@@ -78,9 +87,8 @@ class LazyPage(tk.Frame):
         pad.pack(fill="x", padx=24, pady=18)
 
         tk.Label(pad, text="Preparing…", bg=card, fg=muted).pack(anchor="w", pady=(0, 12))
-        # I keep 5 bars to imply layout; no animation to keep CPU low.
-        for _ in range(5):
-            bar = tk.Frame(pad, bg="#eef2ff", height=14)
+        # A few static bars imply layout; no animation to keep CPU low.
+        for bar in [tk.Frame(pad, **_BAR_OPTS) for _ in range(_SKELETON_BARS)]:
             bar.pack(fill="x", pady=6)
 
         # Ticking status (Working…)
@@ -89,7 +97,7 @@ class LazyPage(tk.Frame):
             text="Starting",
             bg=card,
             fg=muted,
-            font=FONTS.get("small", ("Segoe UI", 9)),
+            font=_SMALL,
         )
         self._status.pack(anchor="w", pady=(10, 0))
         self._schedule_pulse()
@@ -112,9 +120,7 @@ class LazyPage(tk.Frame):
             # Widget likely destroyed during shutdown; stop ticking.
             self._pulse_job = None
 
-    def _on_destroy(self, _event=None) -> None:
-        """Stop scheduled callbacks when destroyed."""
-        self._destroyed = True
+    def _cancel_pulse(self) -> None:
         if self._pulse_job is not None:
             try:
                 self.after_cancel(self._pulse_job)
@@ -122,6 +128,11 @@ class LazyPage(tk.Frame):
                 pass
             self._pulse_job = None
 
+    def _on_destroy(self, _event=None) -> None:
+        """Stop scheduled callbacks when destroyed."""
+        self._destroyed = True
+        self._cancel_pulse()
+
     # ───────────────────────── Thread worker ─────────────────────────
     def _run_worker(self) -> None:
         """Run the blocking worker off-thread and switch back to Tk thread to finish."""
@@ -143,6 +154,9 @@ class LazyPage(tk.Frame):
         """Replace the skeleton with either the rendered page or an error card."""
         if self._destroyed:
             return
+        # The skeleton (and its status label) is going away; stop the ticker first.
+        self._cancel_pulse()
+        self._status = None
 
         # Clear skeleton
         for w in self.winfo_children():
@@ -156,7 +170,7 @@ class LazyPage(tk.Frame):
             return
 
         # Mount real content
-        container = tk.Frame(self, bg=PALETTE.get("bg", "#0E1116"))
+        container = tk.Frame(self, bg=_BG)
         container.pack(fill="both", expand=True)
 
         root = self._render(data, container)
@@ -170,10 +184,7 @@ class LazyPage(tk.Frame):
 
     def _render_error(self, err: BaseException) -> None:
         """Render a simple error card with the exception message."""
-        card = PALETTE.get("card", "#161A22")
-        border = PALETTE.get("border", "#222c3a")
-        danger = PALETTE.get("danger", "#b91c1c")
-        muted = PALETTE.get("muted", "#6b7280")
+        card, border, danger, muted = _CARD, _BORDER, _DANGER, _MUTED
 
         err_card = tk.Frame(self, bg=card, highlightthickness=1, highlightbackground=border)
         err_card.pack(fill="both", expand=True, padx=16, pady=16)
@@ -181,7 +192,7 @@ class LazyPage(tk.Frame):
         tk.Label(
             err_card,
             text="Failed to load",
-            font=FONTS.get("h2", ("Segoe UI", 16)),
+            font=_H2,
             bg=card,
             fg=danger,
         ).pack(anchor="w", padx=16, pady=(16, 6))
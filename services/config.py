@@ -5,16 +5,22 @@ Central app config. Sane defaults with .env / environment overrides.
 
 from __future__ import annotations
 import os
+import re
+from pathlib import Path
 
 # ──────────────────────────────────────────────
 # Load .env (even if this module is imported early)
 # ──────────────────────────────────────────────
 def _load_env() -> None:
+    if os.getenv("COMPLIGUARD_SKIP_DOTENV") == "1":
+        return
     try:
         from dotenv import load_dotenv, find_dotenv
-        # Prefer a .env in the current working dir (your project root)
+        # Project-root .env next to services/ first (no directory walk);
+        # otherwise search up from the current working dir.
         # Do NOT override already-set OS env vars
-        path = find_dotenv(filename=".env", usecwd=True)
+        candidate = Path(__file__).resolve().parents[1] / ".env"
+        path = str(candidate) if candidate.is_file() else find_dotenv(filename=".env", usecwd=True)
         load_dotenv(dotenv_path=path, override=False)
     except Exception:
         # Safe to continue without python-dotenv
@@ -26,11 +32,13 @@ _load_env()
 # ──────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────
+_QUOTED = re.compile(r"""^(["'])(.*)\1$""", re.DOTALL)
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 def _strip_quotes(s: str) -> str:
     s = s.strip()
-    if (s.startswith('"') and s.endswith('"')) or (s.startswith("'") and s.endswith("'")):
-        return s[1:-1].strip()
-    return s
+    m = _QUOTED.match(s)
+    return m.group(2).strip() if m else s
 
 def _env_str(key: str, default: str) -> str:
     v = os.getenv(key)
@@ -52,7 +60,7 @@ def _env_bool(key: str, default: bool) -> bool:
     if v is None:
         return default
     v = _strip_quotes(v).lower()
-    return v in ("1", "true", "yes", "on")
+    return v in _TRUTHY
 
 
 # ──────────────────────────────────────────────
@@ -120,4 +128,6 @@ def _warn_if_insecure() -> None:
         # Never crash on config import
         pass
 
-_warn_if_insecure()
+# Only nag on stdout when explicitly debugging (COMPLIGUARD_DEBUG=1).
+if os.getenv("COMPLIGUARD_DEBUG", "") == "1":
+    _warn_if_insecure()
@@ -0,0 +1,192 @@
+# services/email_queue.py
+"""
+Background email sender.
+
+Callers enqueue a message and return immediately; one daemon thread drains
+the queue in batches and pushes each batch through the pooled SMTP session
+from services.emailer, so a burst of OTPs pays the handshake once.
+"""
+from __future__ import annotations
+
+import atexit
+import queue
+import smtplib
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from email.message import EmailMessage
+from typing import Callable, List, Optional
+
+from .emailer import (
+    EmailSendError, _friendly_error, _is_reconnectable, _pool, _validate_settings, build_message, to_wire,
+)
+
+BATCH_MAX = 100
+# After this many failed messages in one batch I assume SMTP is down and
+# fail the rest of the batch instead of hammering the server.
+BATCH_ABORT_AFTER = 3
+_SHUTDOWN_WAIT_S = 10.0
+
+ErrorCallback = Callable[[EmailSendError], None]
+
+
+@dataclass(slots=True)
+class _Job:
+    from_addr: str
+    to_addrs: List[str]
+    raw: bytes  # serialized on the caller's thread
+    future: Future
+    on_error: Optional[ErrorCallback] = None
+
+
+# Queue items: a _Job, _WARM (dial/refresh the session, send nothing) or
+# None (shutdown).
+_WARM = object()
+_q: "queue.Queue[object]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _log_failure(job: _Job, err: EmailSendError) -> None:
+    print(f"[email] send to {', '.join(job.to_addrs)} failed: {err}")
+
+
+def _fail(job: _Job, err: EmailSendError) -> None:
+    job.future.set_exception(err)
+    try:
+        (job.on_error or (lambda e: _log_failure(job, e)))(err)
+    except Exception as cb_err:
+        print(f"[email] on_error callback raised: {cb_err!r}")
+
+
+def _drain(first: object) -> List[object]:
+    # I don't hold the first message back waiting for company; whatever piled
+    # up behind it while the last batch was sending rides along.
+    items: List[object] = [first]
+    while len(items) < BATCH_MAX:
+        try:
+            items.append(_q.get_nowait())
+        except queue.Empty:
+            break
+    return items
+
+
+def _send_batch(jobs: List[_Job]) -> None:
+    i = 0
+    failures = 0
+    redialed = False
+    while i < len(jobs):
+        try:
+            with _pool.get() as server:
+                while i < len(jobs):
+                    job = jobs[i]
+                    try:
+                        server.sendmail(job.from_addr, job.to_addrs, job.raw)
+                    except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+                        if _is_reconnectable(e):
+                            raise  # session is gone: let the pool drop it
+                        failures += 1
+                        _fail(job, _friendly_error(e))
+                    except Exception as e:
+                        failures += 1
+                        _fail(job, _friendly_error(e))
+                    else:
+                        job.future.set_result(None)
+                    i += 1
+                    if failures >= BATCH_ABORT_AFTER:
+                        break
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+            if not redialed and _is_reconnectable(e):
+                redialed = True
+                continue  # reconnect and retry the message that hit the drop
+            failures = BATCH_ABORT_AFTER
+            err = _friendly_error(e)
+        except Exception as e:
+            # Dial/login failed; nothing else in this batch will get through.
+            failures = BATCH_ABORT_AFTER
+            err = _friendly_error(e)
+        else:
+            err = EmailSendError("Email server looks unavailable; please try again shortly.")
+
+        if failures >= BATCH_ABORT_AFTER:
+            for job in jobs[i:]:
+                _fail(job, err)
+            return
+
+
+def _warm() -> None:
+    try:
+        with _pool.get():
+            pass  # dials + logs in if the pooled session is missing or stale
+    except Exception:
+        pass  # the real send will report the error
+
+
+def _run() -> None:
+    while True:
+        items = _drain(_q.get())
+        jobs = [j for j in items if isinstance(j, _Job)]
+        if jobs:
+            _send_batch(jobs)
+        elif _WARM in items:
+            _warm()
+        if None in items:
+            return  # shutdown sentinel
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="email-sender", daemon=True)
+            _worker.start()
+
+
+def _shutdown() -> None:
+    # Give queued OTPs a chance to go out before the interpreter exits.
+    if _worker is not None and _worker.is_alive():
+        _q.put(None)
+        _worker.join(_SHUTDOWN_WAIT_S)
+
+
+atexit.register(_shutdown)
+
+
+def prewarm() -> None:
+    """
+    Have the sender thread open (or NOOP-check) the SMTP session now, so the
+    EHLO/STARTTLS/LOGIN round-trips overlap with whatever the caller does
+    before it enqueues (hashing, Firestore writes). No-op if SMTP isn't
+    configured.
+    """
+    try:
+        _validate_settings()
+    except EmailSendError:
+        return
+    _ensure_worker()
+    _q.put(_WARM)
+
+
+def enqueue(
+    to_email: str,
+    subject: str,
+    body_text: str,
+    body_html: Optional[str] = None,
+    on_error: Optional[ErrorCallback] = None,
+) -> Future:
+    """
+    Queue an email for the background sender and return right away.
+    Config/recipient problems still raise EmailSendError here; delivery
+    failures go to on_error (called on the sender thread) and the Future.
+    """
+    return enqueue_message(build_message(to_email, subject, body_text, body_html), on_error)
+
+
+def enqueue_message(msg: EmailMessage, on_error: Optional[ErrorCallback] = None) -> Future:
+    """Queue an already-built message (see enqueue)."""
+    fut: Future = Future()
+    _ensure_worker()
+    _q.put(_Job(*to_wire(msg), fut, on_error))
+    return fut
@@ -1,18 +1,23 @@
 # services/emailer.py
 from __future__ import annotations
 
+import atexit
 import os
 import smtplib
 import ssl
+import threading
+import time
+from contextlib import contextmanager
 from email.message import EmailMessage
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
-# I load .env if present so local dev "just works".
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
+# I load .env if present so local dev "just works" (COMPLIGUARD_SKIP_DOTENV=1 opts out).
+if os.getenv("COMPLIGUARD_SKIP_DOTENV") != "1":
+    try:
+        from dotenv import load_dotenv  # type: ignore
+        load_dotenv()
+    except Exception:
+        pass
 
 
 class EmailSendError(RuntimeError):
@@ -82,27 +87,143 @@ SMTP_SEND_TIMEOUT: int = int(CFG_SEND_TO)
 APP_NAME: str = str(CFG_APP_NAME or "CompliGuard")
 
 
+# Settings are fixed at import, so I work out what's missing once; the error
+# is still only raised when something actually tries to send.
+_MISSING_SETTINGS = [k for k, v in (
+    ("SMTP_HOST", SMTP_HOST),
+    ("SMTP_PORT", SMTP_PORT),
+    ("SMTP_USER", SMTP_USER),
+    ("SMTP_PASS", SMTP_PASS),
+    ("SMTP_FROM", SMTP_FROM),
+) if not v]
+_SETTINGS_ERROR: Optional[str] = (
+    "Email isn't configured. Missing: " + ", ".join(_MISSING_SETTINGS) +
+    ". Set them in environment variables or services/config.py."
+) if _MISSING_SETTINGS else None
+
+
 def _validate_settings() -> None:
-    missing = [k for k, v in {
-        "SMTP_HOST": SMTP_HOST,
-        "SMTP_PORT": SMTP_PORT,
-        "SMTP_USER": SMTP_USER,
-        "SMTP_PASS": SMTP_PASS,
-        "SMTP_FROM": SMTP_FROM,
-    }.items() if not v]
-    if missing:
-        raise EmailSendError(
-            "Email isn't configured. Missing: " + ", ".join(missing) +
-            ". Set them in environment variables or services/config.py."
-        )
+    if _SETTINGS_ERROR:
+        raise EmailSendError(_SETTINGS_ERROR)
+
+
+# ── Connection pool ───────────────────────────────────────────
+# I keep one logged-in SMTP session around so bursts (register + resend OTP)
+# pay the EHLO/STARTTLS/LOGIN handshake once instead of on every email.
+_POOL_IDLE_S = 60
+
+
+def _is_reconnectable(exc: Exception) -> bool:
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return True
+    return getattr(exc, "smtp_code", None) == 421
+
+
+# Built once: create_default_context() loads the system CA store.
+_SSL_CTX = ssl.create_default_context()
+
+
+def _connect_ssl() -> smtplib.SMTP:
+    # SSL on connect (e.g., port 465)
+    return smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=SMTP_CONNECT_TIMEOUT, context=_SSL_CTX)
+
+
+def _connect_starttls() -> smtplib.SMTP:
+    # STARTTLS upgrade (e.g., port 587)
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_CONNECT_TIMEOUT)
+    try:
+        server.ehlo()
+        if SMTP_USE_TLS:
+            server.starttls(context=_SSL_CTX)
+            server.ehlo()
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+# SSL vs STARTTLS is fixed by config, so the choice is made once here.
+_CONNECT = _connect_ssl if SMTP_USE_SSL else _connect_starttls
+
+
+class _SmtpPool:
+    def __init__(self) -> None:
+        self.conn: Optional[smtplib.SMTP] = None
+        self.last_used = 0.0
+        self.lock = threading.Lock()
+
+    def _dial(self) -> smtplib.SMTP:
+        server = _CONNECT()
+        try:
+            server.login(SMTP_USER, SMTP_PASS)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _healthy(self) -> bool:
+        if self.conn is None or time.monotonic() - self.last_used >= _POOL_IDLE_S:
+            return False
+        try:
+            return self.conn.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _drop(self) -> None:
+        conn, self.conn = self.conn, None
+        if conn is None:
+            return
+        try:
+            conn.quit()
+        except Exception:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    @contextmanager
+    def get(self) -> Iterator[smtplib.SMTP]:
+        """Hand out the live session (dialing if needed); a failed send discards it."""
+        with self.lock:
+            if not self._healthy():
+                self._drop()
+                self.conn = self._dial()
+            try:
+                yield self.conn
+            except BaseException:
+                self._drop()
+                raise
+            self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        with self.lock:
+            self._drop()
+
+
+_pool = _SmtpPool()
+atexit.register(_pool.close)
 
 
 # ── Core sender ───────────────────────────────────────────────
-def send_email(to_email: str, subject: str, body_text: str, body_html: Optional[str] = None) -> None:
+def _friendly_error(e: BaseException) -> EmailSendError:
+    """Map an smtplib/socket failure to the message the UI shows."""
+    if isinstance(e, EmailSendError):
+        return e
+    if isinstance(e, smtplib.SMTPAuthenticationError):
+        return EmailSendError("Email auth failed. Check SMTP_USER/SMTP_PASSWORD (use a Gmail App Password).")
+    if isinstance(e, smtplib.SMTPConnectError):
+        return EmailSendError("Couldn't connect to SMTP server. Verify SMTP_HOST/PORT and your network.")
+    if isinstance(e, smtplib.SMTPRecipientsRefused):
+        return EmailSendError("The recipient address was rejected by the server.")
+    if isinstance(e, smtplib.SMTPException):
+        return EmailSendError(f"SMTP error: {e.__class__.__name__}: {e}")
+    return EmailSendError(f"Failed to send email: {e.__class__.__name__}: {e}")
+
+
+def build_message(to_email: str, subject: str, body_text: str, body_html: Optional[str] = None) -> EmailMessage:
     """
-    Send an email using TLS (STARTTLS) or SSL depending on config.
-    If body_html is provided, I send a multipart (plain + HTML); otherwise plain text.
-    Raises EmailSendError on any failure.
+    Validate config + recipient and build the message (plain, or plain + HTML).
+    Raises EmailSendError so misconfiguration surfaces before anything is queued.
     """
     _validate_settings()
 
@@ -119,54 +240,70 @@ def send_email(to_email: str, subject: str, body_text: str, body_html: Optional[
         msg.add_alternative(body_html, subtype="html")
     else:
         msg.set_content(body_text or "")
+    return msg
+
+
+def to_wire(msg: EmailMessage) -> Tuple[str, List[str], bytes]:
+    """(from, [to], raw bytes) for server.sendmail; serializing once up front
+    means a retry or a queued send doesn't re-render the MIME tree."""
+    return msg["From"], [msg["To"]], msg.as_bytes()
+
+
+def send_email(to_email: str, subject: str, body_text: str, body_html: Optional[str] = None) -> None:
+    """
+    Send an email using TLS (STARTTLS) or SSL depending on config.
+    If body_html is provided, I send a multipart (plain + HTML); otherwise plain text.
+    Raises EmailSendError on any failure.
+    """
+    from_addr, to_addrs, raw = to_wire(build_message(to_email, subject, body_text, body_html))
 
     try:
-        if SMTP_USE_SSL:
-            # SSL on connect (e.g., port 465)
-            context = ssl.create_default_context()
-            with smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=SMTP_CONNECT_TIMEOUT, context=context) as server:
-                server.login(SMTP_USER, SMTP_PASS)
-                server.send_message(msg)
-        else:
-            # STARTTLS upgrade (e.g., port 587)
-            context = ssl.create_default_context()
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_CONNECT_TIMEOUT) as server:
-                server.ehlo()
-                if SMTP_USE_TLS:
-                    server.starttls(context=context)
-                    server.ehlo()
-                server.login(SMTP_USER, SMTP_PASS)
-                server.send_message(msg)
-
-    except smtplib.SMTPAuthenticationError as e:
-        raise EmailSendError("Email auth failed. Check SMTP_USER/SMTP_PASSWORD (use a Gmail App Password).") from e
-    except smtplib.SMTPConnectError as e:
-        raise EmailSendError("Couldn't connect to SMTP server. Verify SMTP_HOST/PORT and your network.") from e
-    except smtplib.SMTPRecipientsRefused as e:
-        raise EmailSendError("The recipient address was rejected by the server.") from e
-    except smtplib.SMTPException as e:
-        raise EmailSendError(f"SMTP error: {e.__class__.__name__}: {e}") from e
+        for attempt in (0, 1):
+            try:
+                with _pool.get() as server:
+                    server.sendmail(from_addr, to_addrs, raw)
+                break
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+                # The pooled session went stale under me (idle drop or 421); redial once.
+                if attempt or not _is_reconnectable(e):
+                    raise
     except Exception as e:
-        raise EmailSendError(f"Failed to send email: {e.__class__.__name__}: {e}") from e
+        raise _friendly_error(e) from e
 
 
 # ── Convenience helpers ───────────────────────────────────────
-def send_password_otp(to_email: str, code: str) -> None:
-    """
-    Simple helper I use for password reset OTPs.
-    """
-    subject = f"{APP_NAME} Password Reset Code"
-    body_text = (
-        f"Your {APP_NAME} verification code is: {code}\n\n"
-        "This code expires in 10 minutes. If you didn't request this, ignore this email."
-    )
-    body_html = f"""
+# APP_NAME is fixed at import, so the OTP bodies are rendered once with a
+# sentinel where the code goes; per send it's a single str.replace.
+_CODE = "__CODE__"
+_OTP_SUBJECT = f"{APP_NAME} Password Reset Code"
+_OTP_TEXT = (
+    f"Your {APP_NAME} verification code is: {_CODE}\n\n"
+    "This code expires in 10 minutes. If you didn't request this, ignore this email."
+)
+_OTP_HTML = f"""
     <div style="font-family:Segoe UI,Roboto,Arial,sans-serif;">
       <h2 style="margin:0 0 12px;">{APP_NAME} Password Reset</h2>
       <p>Your verification code is:</p>
-      <p style="font-size:24px; letter-spacing:2px; font-weight:700; margin:8px 0;">{code}</p>
+      <p style="font-size:24px; letter-spacing:2px; font-weight:700; margin:8px 0;">{_CODE}</p>
       <p style="color:#6b7280;">This code expires in 10 minutes.</p>
       <p style="color:#6b7280; font-size:12px;">If you didn't request this, you can safely ignore this email.</p>
     </div>
     """.strip()
-    send_email(to_email, subject, body_text, body_html)
+
+
+def _build_otp_msg(to_email: str, code: str) -> EmailMessage:
+    return build_message(
+        to_email,
+        _OTP_SUBJECT,
+        _OTP_TEXT.replace(_CODE, code),
+        _OTP_HTML.replace(_CODE, code),
+    )
+
+
+def send_password_otp(to_email: str, code: str) -> None:
+    """
+    Simple helper I use for password reset OTPs.
+    Queued for the background sender, so this returns without waiting on SMTP.
+    """
+    from services.email_queue import enqueue_message  # local: email_queue imports this module
+    enqueue_message(_build_otp_msg(to_email, code))
@@ -1,14 +1,75 @@
 # services/firebase_auth.py
 from __future__ import annotations
 
-from typing import Optional, Dict, Any, Union
-
-import bcrypt  # kept for legacy string/bytes bcrypt support
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Union, Tuple
 
 from .firebase_client import get_db
 from .config import SUPERADMIN_EMAIL
 from .security import verify_password  # handles {"algo": "...", "hash": "..."}
 
+try:  # optional: bounded TTL map; I fall back to a plain dict below
+    from cachetools import TTLCache  # type: ignore
+except ImportError:  # pragma: no cover - optional dep
+    TTLCache = None  # type: ignore
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# users/{email} cache — saves a Firestore round-trip on repeated logins/lookups.
+# COMPLIGUARD_USER_CACHE_TTL=0 turns it off.
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _user_cache_ttl() -> float:
+    try:
+        return max(0.0, float(os.getenv("COMPLIGUARD_USER_CACHE_TTL", "60")))
+    except ValueError:
+        return 60.0
+
+
+_USER_CACHE_TTL_S = _user_cache_ttl()
+_USER_CACHE_MAX = 1024
+_USER_CACHE_LOCK = threading.Lock()
+# email -> (expires_at monotonic, normalized user)
+_USER_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = (
+    TTLCache(maxsize=_USER_CACHE_MAX, ttl=_USER_CACHE_TTL_S)
+    if TTLCache is not None and _USER_CACHE_TTL_S > 0 else {}
+)
+
+
+def _user_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    if _USER_CACHE_TTL_S <= 0:
+        return None
+    with _USER_CACHE_LOCK:
+        hit = _USER_CACHE.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.monotonic():
+            _USER_CACHE.pop(key, None)
+            return None
+        return dict(hit[1])  # callers may mutate their copy
+
+
+def _user_cache_put(key: str, user: Dict[str, Any]) -> None:
+    if _USER_CACHE_TTL_S <= 0:
+        return
+    with _USER_CACHE_LOCK:
+        if key not in _USER_CACHE and len(_USER_CACHE) >= _USER_CACHE_MAX:
+            _USER_CACHE.pop(next(iter(_USER_CACHE)), None)  # oldest insert (dict fallback)
+        _USER_CACHE[key] = (time.monotonic() + _USER_CACHE_TTL_S, dict(user))
+
+
+def invalidate_user(email: Optional[str]) -> None:
+    """I drop a cached users/{email} entry; call after any write to that doc."""
+    key = (email or "").strip().lower()
+    if not key:
+        return
+    with _USER_CACHE_LOCK:
+        _USER_CACHE.pop(key, None)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers
@@ -19,25 +80,28 @@ def _s(v: Any) -> str:
     return ("" if v is None else str(v)).strip()
 
 
+_USER_DEFAULTS = (
+    ("name", ""),
+    ("role", "company_admin"),  # default for older docs
+    ("company_id", None),       # may be "2" or 2; I don't coerce
+    ("active", True),
+    ("created_at", None),
+    ("password_hash", ""),      # legacy bytes hashes are kept as-is when present
+)
+
+
 def _normalize_user(doc: Dict[str, Any], email_fallback: str) -> Dict[str, Any]:
     """
-    I normalize the user dict so downstream code always finds expected keys.
+    I normalize the user dict *in place* so downstream code always finds
+    expected keys. The caller must own `doc` (e.g. a fresh snap.to_dict()).
     Notes:
       - I keep company_id type as-is (str or int).
       - I preserve password_hash format (dict or legacy str/bytes).
     """
-    d = (doc or {}).copy()
-    d.setdefault("email", (email_fallback or "").lower())
-    d.setdefault("name", "")
-    d.setdefault("role", "company_admin")  # default for older docs
-    d.setdefault("company_id", None)       # may be "2" or 2; I don't coerce
-    d.setdefault("active", True)
-    d.setdefault("created_at", None)
-    d.setdefault(
-        "password_hash",
-        b"" if isinstance(doc.get("password_hash"), (bytes, bytearray)) else ""
-    )
-    return d
+    doc.setdefault("email", (email_fallback or "").lower())
+    for key, default in _USER_DEFAULTS:
+        doc.setdefault(key, default)
+    return doc
 
 
 def _get_user_doc(email: str) -> Optional[Dict[str, Any]]:
@@ -47,14 +111,52 @@ def _get_user_doc(email: str) -> Optional[Dict[str, Any]]:
     """
     if not email:
         return None
+    key = email.lower()
+    cached = _user_cache_get(key)
+    if cached is not None:
+        return cached
+
     db = get_db()
-    snap = db.collection("users").document(email.lower()).get()
+    snap = db.collection("users").document(key).get()
     if not snap.exists:
         return None
 
     data = snap.to_dict() or {}
     data["id"] = snap.id
-    return _normalize_user(data, email)
+    user = _normalize_user(data, email)
+    _user_cache_put(key, user)
+    return user
+
+
+# Recent *failed* legacy bcrypt checks, so hammering the same wrong password
+# doesn't burn ~100ms of CPU per try. Only misses are kept: a cached hit would
+# be a password-equivalent sitting in memory.
+_BCRYPT_MISS_TTL_S = 5.0
+_BCRYPT_MISS_MAX = 256
+_BCRYPT_MISSES: Dict[bytes, float] = {}
+_BCRYPT_MISS_LOCK = threading.Lock()
+
+
+def _bcrypt_check(password: bytes, hashed: bytes) -> bool:
+    import bcrypt
+
+    key = hashlib.sha256(hashlib.sha256(password).digest() + hashed).digest()
+    now = time.monotonic()
+    with _BCRYPT_MISS_LOCK:
+        until = _BCRYPT_MISSES.get(key)
+        if until is not None:
+            if until > now:
+                return False
+            del _BCRYPT_MISSES[key]
+
+    if bcrypt.checkpw(password, hashed):
+        return True
+
+    with _BCRYPT_MISS_LOCK:
+        if len(_BCRYPT_MISSES) >= _BCRYPT_MISS_MAX:
+            _BCRYPT_MISSES.pop(next(iter(_BCRYPT_MISSES)), None)
+        _BCRYPT_MISSES[key] = now + _BCRYPT_MISS_TTL_S
+    return False
 
 
 def _check_password(
@@ -74,17 +176,16 @@ def _check_password(
     if isinstance(stored, dict):
         return verify_password(input_password, stored)
 
-    # Legacy bcrypt string
+    # Legacy bcrypt string/bytes (bcrypt only imported when one shows up)
     if isinstance(stored, str) and stored.startswith("$2"):
         try:
-            return bcrypt.checkpw(input_password.encode("utf-8"), stored.encode("utf-8"))
+            return _bcrypt_check(input_password.encode("utf-8"), stored.encode("utf-8"))
         except Exception:
             return False
 
-    # Legacy bcrypt bytes
     if isinstance(stored, (bytes, bytearray)):
         try:
-            return bcrypt.checkpw(input_password.encode("utf-8"), bytes(stored))
+            return _bcrypt_check(input_password.encode("utf-8"), bytes(stored))
         except Exception:
             return False
 
@@ -114,34 +215,99 @@ def _company_suspended_from_doc(d: Dict[str, Any]) -> Optional[bool]:
     return None
 
 
+# company_id -> (suspended, fetched_at monotonic). Served fresh for
+# _SUSP_FRESH_S, served stale while a background refresh runs until
+# _SUSP_MAX_STALE_S, fetched synchronously after that.
+_SUSP_FRESH_S = 10.0
+_SUSP_MAX_STALE_S = 60.0
+_SUSP_CACHE: Dict[Any, Tuple[Optional[bool], float]] = {}
+_SUSP_REFRESHING: set = set()
+_SUSP_LOCK = threading.Lock()
+_SUSP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="company-status")
+# separate pool: refreshes running on _SUSP_EXECUTOR fan out into this one
+_LOOKUP_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="company-lookup")
+
+
+def _refresh_company_suspended(company_id: Any) -> Optional[bool]:
+    try:
+        value = _fetch_company_suspended(company_id)
+    except Exception:
+        # Keep serving the stale value; the next stale read tries again.
+        with _SUSP_LOCK:
+            _SUSP_REFRESHING.discard(company_id)
+        raise
+    with _SUSP_LOCK:
+        _SUSP_CACHE[company_id] = (value, time.monotonic())
+        _SUSP_REFRESHING.discard(company_id)
+    return value
+
+
+def invalidate_company(company_id: Any) -> None:
+    """I drop cached suspension state for a company (any id spelling: 2 or "2")."""
+    key = _s(company_id)
+    if not key:
+        return
+    with _SUSP_LOCK:
+        for k in [k for k in _SUSP_CACHE if _s(k) == key]:
+            del _SUSP_CACHE[k]
+
+
 def is_company_suspended(company_id: Any) -> Optional[bool]:
+    """
+    I return whether the company is suspended (True/False, or None if the
+    record is missing), served from a short stale-while-revalidate cache.
+    """
+    if company_id is None or _s(company_id) == "":
+        return None
+    try:
+        hash(company_id)
+    except TypeError:
+        return _fetch_company_suspended(company_id)
+
+    now = time.monotonic()
+    with _SUSP_LOCK:
+        hit = _SUSP_CACHE.get(company_id)
+        age = now - hit[1] if hit else None
+        if hit and age < _SUSP_FRESH_S:
+            return hit[0]
+        if hit and age < _SUSP_MAX_STALE_S:
+            if company_id not in _SUSP_REFRESHING:
+                _SUSP_REFRESHING.add(company_id)
+                _SUSP_EXECUTOR.submit(_refresh_company_suspended, company_id)
+            return hit[0]
+        _SUSP_REFRESHING.add(company_id)
+    return _refresh_company_suspended(company_id)
+
+
+def _fetch_company_suspended(company_id: Any) -> Optional[bool]:
     """
     I look up the company and return whether it is suspended.
     Checks in order: companies/{docId}, then where('id' == company_id),
     then where('company_id' == company_id). Returns True/False,
     or None if the record is missing.
     """
-    if company_id is None or _s(company_id) == "":
-        return None
+    col = get_db().collection("companies")
 
-    db = get_db()
+    def _by_doc_id() -> Optional[Dict[str, Any]]:
+        snap = col.document(str(company_id)).get()
+        return (snap.to_dict() or {}) if snap and snap.exists else None
 
-    # 1) try document id exact
-    try:
-        snap = db.collection("companies").document(str(company_id)).get()
-        if snap and snap.exists:
-            return _company_suspended_from_doc(snap.to_dict() or {})
-    except Exception:
-        pass
+    def _by_field(field: str) -> Optional[Dict[str, Any]]:
+        q = col.where(field, "==", company_id).limit(1).get()
+        return (q[0].to_dict() or {}) if q else None
 
-    # 2) try 'id' / 'company_id' field matches
-    for field in ("id", "company_id"):
+    # The two field queries go out alongside the doc read, so a miss costs
+    # one round-trip instead of three; results are still taken in order.
+    fallbacks = [_LOOKUP_EXECUTOR.submit(_by_field, f) for f in ("id", "company_id")]
+    for lookup in [_by_doc_id] + [f.result for f in fallbacks]:
         try:
-            q = db.collection("companies").where(field, "==", company_id).limit(1).get()
-            if q:
-                return _company_suspended_from_doc(q[0].to_dict() or {})
+            d = lookup()
         except Exception:
-            pass
+            continue
+        if d is not None:
+            for f in fallbacks:
+                f.cancel()
+            return _company_suspended_from_doc(d)
 
     return None
 
@@ -1,16 +1,22 @@
 # services/firebase_client.py
+from __future__ import annotations
+
+import functools
 import os
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Optional
 
 # Force REST transport globally (must be set before firestore import)
 os.environ["GOOGLE_CLOUD_DISABLE_GRPC"] = "true"
 
-from google.cloud import firestore
-from google.oauth2 import service_account
+if TYPE_CHECKING:  # the real imports happen in get_db() on first use
+    from google.cloud import firestore
 
 _DB: Optional[firestore.Client] = None
+_DB_LOCK = threading.Lock()
 
 
+@functools.lru_cache(maxsize=1)
 def _find_key_path() -> str:
     base_dir = os.path.dirname(os.path.dirname(__file__))  # project root
     env_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "")
@@ -30,13 +36,29 @@ def get_db() -> firestore.Client:
     global _DB
     if _DB is not None:
         return _DB
+    # Double-checked so two threads hitting the first call don't each build
+    # a client (and its own HTTP connection pool).
+    with _DB_LOCK:
+        if _DB is None:
+            _DB = _build_client()
+    return _DB
+
+
+@functools.lru_cache(maxsize=1)
+def _load_creds():
+    """Parse the service-account JSON once (project_id rides along on it)."""
+    from google.oauth2 import service_account
 
-    key_path = _find_key_path()
-    creds = service_account.Credentials.from_service_account_file(
-        key_path,
+    return service_account.Credentials.from_service_account_file(
+        _find_key_path(),
         scopes=["https://www.googleapis.com/auth/cloud-platform"],
     )
 
+
+def _build_client() -> firestore.Client:
+    from google.cloud import firestore
+
+    creds = _load_creds()
+
     # With gRPC disabled, default client will use REST under the hood.
-    _DB = firestore.Client(project=creds.project_id, credentials=creds)
-    return _DB
+    return firestore.Client(project=creds.project_id, credentials=creds)
@@ -1,33 +1,34 @@
 # services/firebase_db.py
 from typing import Dict, List, Optional
-from firebase_admin import firestore
 from .firebase_client import get_db
 
-# --------- counters (transactional) ---------
+# --------- counters (server-side Increment) ---------
 _COUNTERS_DOC = ("meta", "counters")   # collection "meta", doc "counters"
 _COUNTER_FIELD = "company_seq"
+_counters_initialized = False          # skip the existence GET after the first call
 
 def _ensure_counters_doc(db):
+    global _counters_initialized
+    if _counters_initialized:
+        return
     ref = db.collection(_COUNTERS_DOC[0]).document(_COUNTERS_DOC[1])
     snap = ref.get()
     if not snap.exists:
         ref.set({_COUNTER_FIELD: 0})
-
-@firestore.transactional
-def _next_company_seq_txn(transaction, db) -> int:
-    ref = db.collection(_COUNTERS_DOC[0]).document(_COUNTERS_DOC[1])
-    snapshot = ref.get(transaction=transaction)
-    data = snapshot.to_dict() or {}
-    current = int(data.get(_COUNTER_FIELD, 0))
-    nxt = current + 1
-    transaction.update(ref, {_COUNTER_FIELD: nxt})
-    return nxt
+    _counters_initialized = True
 
 def next_company_seq() -> int:
+    """
+    Bump the counter with a server-side Increment (one write, no transaction
+    retries under contention) and read the new value back.
+    """
+    from firebase_admin import firestore
     db = get_db()
     _ensure_counters_doc(db)
-    txn = db.transaction()
-    return _next_company_seq_txn(txn, db)
+    ref = db.collection(_COUNTERS_DOC[0]).document(_COUNTERS_DOC[1])
+    ref.update({_COUNTER_FIELD: firestore.Increment(1)})
+    data = ref.get().to_dict() or {}
+    return int(data.get(_COUNTER_FIELD, 0))
 
 # ---------- Companies ----------
 def create_company(name: str, code: Optional[str] = None) -> str:
@@ -37,47 +38,62 @@ def create_company(name: str, code: Optional[str] = None) -> str:
     """
     if not name or not name.strip():
         raise ValueError("Company name is required.")
+    from firebase_admin import firestore
+    from google.api_core.exceptions import AlreadyExists
     db = get_db()
-    seq = next_company_seq()                 # 1, 2, 3, ...
-    doc_id = str(seq)                        # use numeric id as document id
-    ref = db.collection("companies").document(doc_id)
-    data = {
-        "id": seq,                            # store numeric id for queries/sorts
-        "name": name.strip(),
-        "code": (code or f"C{seq:04d}"),
-        "created_at": firestore.SERVER_TIMESTAMP,
-    }
-    ref.set(data)
-    return doc_id
+    # Increment + read-back isn't atomic: two concurrent creators can read the
+    # same value. create() refuses an existing doc, so the loser takes the next seq.
+    for _ in range(5):
+        seq = next_company_seq()                 # 1, 2, 3, ...
+        doc_id = str(seq)                        # use numeric id as document id
+        ref = db.collection("companies").document(doc_id)
+        data = {
+            "id": seq,                            # store numeric id for queries/sorts
+            "name": name.strip(),
+            "code": (code or f"C{seq:04d}"),
+            "created_at": firestore.SERVER_TIMESTAMP,
+        }
+        try:
+            ref.create(data)
+        except AlreadyExists:
+            continue
+        return doc_id
+    raise RuntimeError("Couldn't allocate a company id; please try again.")
+
+# Fields the company list/grid reads (name aliases + status flags included);
+# projecting to these keeps large per-company blobs off the wire.
+_COMPANY_LIST_FIELDS = [
+    "id", "name", "display_name", "company_name", "code",
+    "created_at", "createdAt", "suspended", "active", "status",
+]
+
+def _is_numeric_id(v) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
 
 def list_companies() -> List[Dict]:
     """
     Returns companies sorted by numeric id ascending.
-    [{id:int, name, code, created_at}, ...]
+    [{id:int, name, code, created_at, ...status fields}, ...]
     """
     db = get_db()
-    # Prefer ordering by 'id' (int). Fallback to name if old docs exist.
-    snaps = db.collection("companies").order_by("id").stream()
-    out: List[Dict] = []
+    # Server already orders by 'id' (and leaves out docs without the field);
+    # numbers come before other types there, so a single partition pass
+    # (numeric ids first, null/other ids after) replaces the old local sort.
+    snaps = db.collection("companies").select(_COMPANY_LIST_FIELDS).order_by("id").stream()
+    typed: List[Dict] = []
+    untyped: List[Dict] = []
     for s in snaps:
         d = s.to_dict() or {}
-        # normalize id: if missing, try to parse doc id as int; else skip
-        if "id" not in d:
-            try:
-                d["id"] = int(s.id)
-            except Exception:
-                d["id"] = None
         d["doc_id"] = s.id
-        out.append(d)
-    # final safety sort (local) in case mixed data
-    out.sort(key=lambda x: (x.get("id") is None, x.get("id", 0)))
-    return out
+        (typed if _is_numeric_id(d.get("id")) else untyped).append(d)
+    return typed + untyped
 
 # ---------- Users (kept for reference; not used on this page) ----------
 def create_company_admin(company_id: str, email: str, role: str = "company_admin"):
     """
     Mirror a company admin into 'users' (Auth integration handled elsewhere).
     """
+    from firebase_admin import firestore
     db = get_db()
     db.collection("users").document(email.lower()).set({
         "email": email.lower(),
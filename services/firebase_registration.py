@@ -1,38 +1,73 @@
 # services/firebase_registration.py
-from typing import Tuple
-from datetime import datetime, timedelta, timezone
-import random, bcrypt
-
-from firebase_admin import firestore
+from typing import Callable, Optional, Tuple
+from datetime import datetime
+import hmac
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+
+# bcrypt and firebase_admin.firestore are imported where they're used so that
+# importing this module (e.g. from the login page) stays cheap.
 from .firebase_client import get_db
-from .emailer import send_email, EmailSendError
+from .emailer import EmailSendError, build_message
+from .email_queue import enqueue_message, prewarm
+from .firebase_auth import invalidate_user
 
 OTP_TTL_MINUTES = 10
 RESEND_COOLDOWN_SECONDS = 30
 
-def _utc_now():
-    return datetime.now(timezone.utc)
+# bcrypt is pure CPU and releases the GIL, so hashing runs here while the
+# caller's thread does the Firestore round-trips.
+_PW_EXEC = ThreadPoolExecutor(max_workers=max(2, os.cpu_count() or 2), thread_name_prefix="pw-hash")
+
+def _epoch_field(reg: dict, key: str, default: float) -> float:
+    """
+    Epoch seconds for a registration timestamp. New docs store `<key>_ts`
+    floats; docs written before that only have the ISO string, which I still
+    read so pending registrations survive the switch.
+    """
+    ts = reg.get(key + "_ts")
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    try:
+        return datetime.fromisoformat(reg.get(key)).timestamp()
+    except Exception:
+        return default
 
 def _generate_otp(n: int = 6) -> str:
-    return "".join(str(random.randint(0,9)) for _ in range(n))
-
-def _send_otp_email(to_email: str, otp: str, company_name: str):
-    subject = "Your CompliGuard verification code"
-    body = (
-        f"Hello,\n\n"
-        f"Use this code to verify your CompliGuard account for '{company_name}':\n\n"
-        f"    {otp}\n\n"
-        f"This code expires in {OTP_TTL_MINUTES} minutes.\n\n"
-        f"If you didn’t request this, please ignore this email.\n\n"
-        f"— CompliGuard"
-    )
-    send_email(to_email, subject, body)
+    return f"{secrets.randbelow(10 ** n):0{n}d}"
+
+# Rendered once with sentinels; per send it's two str.replace calls.
+_OTP = "__OTP__"
+_COMPANY = "__COMPANY__"
+_OTP_SUBJECT = "Your CompliGuard verification code"
+_OTP_BODY = (
+    "Hello,\n\n"
+    f"Use this code to verify your CompliGuard account for '{_COMPANY}':\n\n"
+    f"    {_OTP}\n\n"
+    f"This code expires in {OTP_TTL_MINUTES} minutes.\n\n"
+    "If you didn’t request this, please ignore this email.\n\n"
+    "— CompliGuard"
+)
+
+def _build_otp_msg(to_email: str, otp: str, company_name: str) -> EmailMessage:
+    # code first, so a company name that happens to contain a sentinel stays literal
+    body = _OTP_BODY.replace(_OTP, otp).replace(_COMPANY, company_name)
+    return build_message(to_email, _OTP_SUBJECT, body)
+
+def _send_otp_email(to_email: str, otp: str, company_name: str,
+                    on_error: Optional[Callable[[EmailSendError], None]] = None):
+    # Queued: the UI returns right away; delivery failures land in on_error.
+    enqueue_message(_build_otp_msg(to_email, otp, company_name), on_error=on_error)
 
 def begin_company_registration(email: str, password_plain: str,
                                company_name: str, admin_name: str) -> str:
     """
-    Creates a pending registration with an OTP, emails the OTP.
-    If email fails, the registration doc is **deleted** and a friendly error is raised.
+    Creates a pending registration with an OTP, queues the OTP email.
+    If email isn't configured a friendly error is raised; if delivery fails later
+    the registration doc is **deleted** either way.
     Returns registration_id. (No OTP returned.)
     """
     if not email or "@" not in email:
@@ -44,15 +79,23 @@ def begin_company_registration(email: str, password_plain: str,
     if not admin_name.strip():
         raise ValueError("Admin name is required.")
 
+    import bcrypt
+    from firebase_admin import firestore
+
+    # SMTP handshake and hashing both overlap with the existence check below
+    prewarm()
+    pw_future = _PW_EXEC.submit(bcrypt.hashpw, password_plain.encode(), bcrypt.gensalt())
+
     db = get_db()
     # prevent duplicate active users
     existing_user = db.collection("users").document(email.lower()).get()
     if existing_user.exists:
+        pw_future.cancel()
         raise ValueError("An account already exists for this email.")
 
     otp = _generate_otp(6)
-    expires_at = _utc_now() + timedelta(minutes=OTP_TTL_MINUTES)
-    pw_hash = bcrypt.hashpw(password_plain.encode(), bcrypt.gensalt()).decode()
+    now = time.time()
+    pw_hash = pw_future.result().decode()
 
     reg_ref = db.collection("registrations").document()  # auto-id
     reg_id = reg_ref.id
@@ -62,20 +105,23 @@ def begin_company_registration(email: str, password_plain: str,
         "company_name": company_name.strip(),
         "admin_name": admin_name.strip(),
         "otp_code": otp,
-        "otp_expires_at": expires_at.isoformat(),
-        "resend_available_at": _utc_now().isoformat(),
+        "otp_expires_at_ts": now + OTP_TTL_MINUTES * 60,
+        "resend_available_at_ts": now,
         "status": "pending",
         "created_at": firestore.SERVER_TIMESTAMP,
     })
 
-    try:
-        _send_otp_email(email, otp, company_name)
-    except EmailSendError as e:
+    def _rollback(_err=None):
         # roll back: delete pending registration
         try:
             reg_ref.delete()
         except Exception:
             pass
+
+    try:
+        _send_otp_email(email, otp, company_name, on_error=_rollback)
+    except EmailSendError as e:
+        _rollback()
         # surface a friendly message to UI
         raise ValueError(str(e)) from e
 
@@ -86,6 +132,7 @@ def resend_company_otp(registration_id: str):
     Generates a new OTP, applies cooldown, and emails it.
     Raises a friendly ValueError for the UI.
     """
+    prewarm()  # SMTP handshake overlaps with the Firestore read/update
     db = get_db()
     ref = db.collection("registrations").document(registration_id)
     snap = ref.get()
@@ -96,28 +143,27 @@ def resend_company_otp(registration_id: str):
     if reg.get("status") != "pending":
         raise ValueError("Registration is not pending.")
 
-    now = _utc_now()
-    try:
-        last = datetime.fromisoformat(reg.get("resend_available_at"))
-    except Exception:
-        last = now
-    delta = (now - last).total_seconds()
+    now = time.time()
+    delta = now - _epoch_field(reg, "resend_available_at", now)
     if delta < RESEND_COOLDOWN_SECONDS:
         raise ValueError(f"Please wait {int(RESEND_COOLDOWN_SECONDS - delta)}s before requesting a new code.")
 
     new_otp = _generate_otp(6)
-    expires_at = now + timedelta(minutes=OTP_TTL_MINUTES)
 
+    # Build first: a config error must not burn the cooldown or replace the
+    # code the user already has.
     try:
-        _send_otp_email(reg["email"], new_otp, reg["company_name"])
+        msg = _build_otp_msg(reg["email"], new_otp, reg["company_name"])
     except EmailSendError as e:
         raise ValueError(str(e)) from e
 
+    # Store the new code before queueing so it is valid by the time it arrives.
     ref.update({
         "otp_code": new_otp,
-        "otp_expires_at": expires_at.isoformat(),
-        "resend_available_at": now.isoformat(),
+        "otp_expires_at_ts": now + OTP_TTL_MINUTES * 60,
+        "resend_available_at_ts": now,
     })
+    enqueue_message(msg)
 
 def confirm_company_registration(registration_id: str, otp_input: str) -> str:
     """
@@ -126,6 +172,7 @@ def confirm_company_registration(registration_id: str, otp_input: str) -> str:
     """
     if not registration_id or not otp_input:
         raise ValueError("Missing registration or OTP.")
+    from firebase_admin import firestore
 
     db = get_db()
     reg_ref = db.collection("registrations").document(registration_id)
@@ -137,25 +184,26 @@ def confirm_company_registration(registration_id: str, otp_input: str) -> str:
     if reg.get("status") != "pending":
         raise ValueError("Registration is not pending.")
 
-    # expiry check
-    try:
-        exp = datetime.fromisoformat(reg.get("otp_expires_at"))
-    except Exception:
-        exp = _utc_now() - timedelta(seconds=1)
-    if _utc_now() > exp:
+    # expiry check (unreadable expiry counts as expired)
+    if time.time() > _epoch_field(reg, "otp_expires_at", 0.0):
         raise ValueError("OTP has expired. Please resend a new code.")
 
-    # code check
-    if str(reg.get("otp_code")) != str(otp_input).strip():
+    # code check (constant-time: don't leak how many leading digits matched)
+    if not hmac.compare_digest(str(reg.get("otp_code")).encode(), str(otp_input).strip().encode()):
         raise ValueError("Invalid OTP code.")
 
     # create company with incremental numeric id (via firebase_db)
     from .firebase_db import create_company  # lazy import to avoid cycle
     company_id = create_company(reg["company_name"])
 
-    # create user (company admin) for Firestore login
+    # create user (company admin) for Firestore login and mark the
+    # registration verified in one commit. create() fails if the user doc
+    # already exists (e.g. the same email verified twice), instead of
+    # silently overwriting it like set() would.
+    from google.api_core.exceptions import AlreadyExists
     email = reg["email"].lower()
-    db.collection("users").document(email).set({
+    batch = db.batch()
+    batch.create(db.collection("users").document(email), {
         "email": email,
         "name": reg["admin_name"],
         "role": "company_admin",
@@ -164,12 +212,21 @@ def confirm_company_registration(registration_id: str, otp_input: str) -> str:
         "password_hash": reg["password_hash"],
         "created_at": firestore.SERVER_TIMESTAMP,
     })
-
-    # mark registration complete
-    reg_ref.update({
+    batch.update(reg_ref, {
         "status": "verified",
         "verified_at": firestore.SERVER_TIMESTAMP,
         "company_id": company_id,
     })
+    try:
+        batch.commit()
+    except AlreadyExists as e:
+        # don't leave the just-created company behind
+        try:
+            db.collection("companies").document(company_id).delete()
+        except Exception:
+            pass
+        raise ValueError("An account already exists for this email.") from e
+
+    invalidate_user(email)
 
     return company_id
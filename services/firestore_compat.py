@@ -23,16 +23,24 @@ except Exception:
         _HAS_FIELD_FILTER = False
 
 
-def _apply(q: Any, field: str, op: str, value: Any):
-    """Apply a single filter: prefer new API, fallback to old .where()."""
-    if _HAS_FIELD_FILTER and FieldFilter is not None:
+# The SDK capability is fixed at import, so I pick the implementation once
+# instead of branching on every query-builder call.
+if _HAS_FIELD_FILTER and FieldFilter is not None:
+    def _apply(q: Any, field: str, op: str, value: Any):
+        """Apply a single filter via the new filter=FieldFilter API."""
         return q.where(filter=FieldFilter(field, op, value))
-    return q.where(field, op, value)
 
+    # Public helpers for common operators
+    def eq(q: Any, field: str, value: Any):  # hottest path: no extra frame
+        return q.where(filter=FieldFilter(field, "==", value))
+else:
+    def _apply(q: Any, field: str, op: str, value: Any):
+        """Apply a single filter via the old .where(field, op, value)."""
+        return q.where(field, op, value)
 
-# Public helpers for common operators
-def eq(q: Any, field: str, value: Any):
-    return _apply(q, field, "==", value)
+    # Public helpers for common operators
+    def eq(q: Any, field: str, value: Any):
+        return q.where(field, "==", value)
 
 def gt(q: Any, field: str, value: Any):
     return _apply(q, field, ">", value)
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import Optional
 
 from .emailer import send_email, EmailSendError  # delivery + friendly errors
+from .email_queue import enqueue  # background delivery for latency-sensitive flows
 from .config import SUPERADMIN_EMAIL  # not required, but available for CC/visibility
 
 
@@ -85,6 +86,7 @@ def _code_block(code: str) -> str:
 def send_password_otp(to_email: str, code: str, expires_minutes: int = 10) -> None:
     """
     Send a one-time code for password reset.
+    Queued for the background sender; config problems still raise EmailSendError.
     """
     subject = f"{_BRAND} — Password Reset Code"
     text = (
@@ -101,7 +103,7 @@ def send_password_otp(to_email: str, code: str, expires_minutes: int = 10) -> No
 </p>
 """
     html = _shell_html(html_inner, subject)
-    send_email(to_email, subject, text, body_html=html)
+    enqueue(to_email, subject, text, body_html=html)
 
 
 def send_admin_created(to_email: str, company_name: str, temp_password: Optional[str] = None) -> None:
@@ -7,6 +7,7 @@ from firebase_admin import firestore
 from services.firebase_client import get_db
 from services.security import hash_password
 from services.firestore_compat import eq  # ← compat helpers
+from services.firebase_auth import invalidate_user
 
 
 # ────────────────────────────────────────────────────────────────
@@ -149,6 +150,7 @@ def disable_user(email: str) -> None:
     if not ref.get().exists:
         raise ValueError("User not found.")
     ref.update({"status": "disabled"})
+    invalidate_user(email_n)
 
 
 def enable_user(email: str) -> None:
@@ -159,6 +161,7 @@ def enable_user(email: str) -> None:
     if not ref.get().exists:
         raise ValueError("User not found.")
     ref.update({"status": "active"})
+    invalidate_user(email_n)
 
 
 def delete_user(email: str) -> None:
@@ -169,3 +172,4 @@ def delete_user(email: str) -> None:
     if not ref.get().exists:
         raise ValueError("User not found.")
     ref.delete()
+    invalidate_user(email_n)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import unicodedata
+from dataclasses import dataclass
 from urllib.parse import urlparse
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone, timedelta
@@ -69,6 +70,17 @@ def _normalize_zone(doc_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
     d["id"] = doc_id
     return d
 
+@dataclass(slots=True)
+class CameraRecord:
+    id: str
+    name: str
+    zone_id: Optional[str]
+    mode: str
+    online: Any = None
+    last_heartbeat: Any = None
+    last_seen: Any = None
+    last_ping: Any = None
+
 def camera_status(cam: dict, *, heartbeat_seconds: int = 120) -> tuple[str, str]:
     hb = cam.get("last_heartbeat")
     if hb is not None:
@@ -283,6 +295,33 @@ def list_cameras_by_company(company_id: Any) -> List[Dict[str, Any]]:
     cams.sort(key=lambda x: (x.get("name") or "").lower())
     return cams
 
+def list_cameras_by_company_grouped(company_id: Any) -> Dict[str, List[CameraRecord]]:
+    """Company cameras as slim records bucketed by zone_id (name order kept); unassigned cameras are skipped."""
+    db = get_db()
+    seen: Dict[str, CameraRecord] = {}
+    for k in _company_keys(company_id):
+        try:
+            for s in eq(db.collection("cameras"), "company_id", k).stream():
+                d = s.to_dict() or {}
+                seen[s.id] = CameraRecord(
+                    id=s.id,
+                    name=d.get("name", s.id),
+                    zone_id=d.get("zone_id"),
+                    mode=(d.get("mode") or "monitor"),
+                    online=d.get("online"),
+                    last_heartbeat=d.get("last_heartbeat"),
+                    last_seen=d.get("last_seen"),
+                    last_ping=d.get("last_ping"),
+                )
+        except Exception:
+            pass
+    grouped: Dict[str, List[CameraRecord]] = {}
+    for c in sorted(seen.values(), key=lambda c: (c.name or "").lower()):
+        zid = str(c.zone_id or "")
+        if zid:
+            grouped.setdefault(zid, []).append(c)
+    return grouped
+
 def list_cameras_by_zone(zone_id: str) -> List[Dict[str, Any]]:
     if not zone_id:
         return []
@@ -383,6 +422,20 @@ def delete_camera(camera_id: str) -> None:
         raise ValueError("Camera not found.")
     ref.delete()
 
+def delete_cameras_by_zone(zone_id: str) -> int:
+    """Delete every camera in a zone with batched writes; returns how many were removed."""
+    if not zone_id:
+        raise ValueError("Zone id is required.")
+    db = get_db()
+    refs = [s.reference for s in eq(db.collection("cameras"), "zone_id", zone_id).stream()]
+    # Firestore caps a write batch at 500 operations
+    for i in range(0, len(refs), 500):
+        batch = db.batch()
+        for ref in refs[i:i + 500]:
+            batch.delete(ref)
+        batch.commit()
+    return len(refs)
+
 def assign_camera_to_zone(camera_id: str, zone_id: Optional[str]) -> None:
     if not camera_id:
         raise ValueError("camera_id required.")
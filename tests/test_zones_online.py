@@ -0,0 +1,62 @@
+"""
+_batch_online (numpy) must make exactly the same debounce decisions as the
+per-camera _debounced_online loop it replaces for large fleets.
+"""
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+zones = pytest.importorskip("pages.zones")
+
+from services.zones import CameraRecord
+
+ZonesPage = zones.ZonesPage
+
+
+def _bare_page():
+    # skip Tk/widget setup; only the debounce state is needed
+    page = object.__new__(ZonesPage)
+    page._reset_online_state()
+    return page
+
+
+def _heartbeat(rng, now):
+    age = rng.choice([5, 30, 59, 61, 120, 3600])
+    dt = datetime.fromtimestamp(now - age, tz=timezone.utc)
+    return rng.choice([dt, dt.isoformat(), dt.isoformat().replace("+00:00", "Z")])
+
+
+def _camera(rng, cam_id, now):
+    fields = {"last_heartbeat": None, "last_seen": None, "last_ping": None}
+    if rng.random() < 0.8:  # the rest fall back to the reported `online` flag
+        fields[rng.choice(list(fields))] = _heartbeat(rng, now)
+    return CameraRecord(
+        id=cam_id, name=cam_id, zone_id="z", mode="monitor",
+        online=rng.random() < 0.5, **fields,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_matches_scalar(seed):
+    rng = random.Random(seed)
+    scalar, batch = _bare_page(), _bare_page()
+    pool = [f"cam-{i}" for i in range(600)]  # > 2 growths past the initial 256 slots
+    now = 1_700_000_000.0
+
+    for _ in range(40):
+        now += rng.choice([1, 5, 30, 90])
+        ids = rng.sample(pool, rng.randint(zones.VECTOR_MIN_CAMS + 1, 400))
+        cams = [_camera(rng, cid, now) for cid in ids]
+
+        expected = {c.id: scalar._debounced_online(c, now) for c in cams}
+        got = batch._batch_online(cams, now)
+
+        assert got == expected
+        assert batch._cam_index == scalar._cam_index
+        n = len(scalar._cam_index)
+        assert batch._streak_arr[:n].tolist() == scalar._streak_arr[:n].tolist()
+        assert batch._decision_arr[:n].tolist() == scalar._decision_arr[:n].tolist()
+
+    assert len(batch._streak_arr) > 256